@@ -4,6 +4,11 @@ Debug script to inspect ESPN's HTML structure and test selectors.
 This will help us understand why games aren't being found.
 """
 
+import argparse
+import functools
+import hashlib
+import pickle
+import re
 import sys
 from pathlib import Path
 
@@ -11,9 +16,39 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from b1gpicks import Scraper
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
 
-def debug_schedule_page():
+# The schedule diagnostics only look at tables and links; everything else
+# (notably the large inline <script> blobs) is dropped while parsing.
+SCHEDULE_STRAINER = SoupStrainer(['table', 'tbody', 'a'])
+
+# href values of game links, matched directly against the raw page bytes
+GAME_HREF_RE = re.compile(rb'href="([^"]*/game/[^"]*)"')
+
+# Percentage values such as 9.3% or 91%, matched against the raw page bytes
+PCT_RE = re.compile(rb'\d+\.?\d*%')
+
+# Parsed game page diagnostics, keyed by a hash of the page bytes
+PARSE_CACHE_DIR = Path('.b1g_parse_cache')
+PARSE_CACHE_VERSION = 1
+
+# Case-insensitive class-name substrings used by the legacy diagnostics
+SCHEDULE_CLASS_RE = re.compile(r'schedule', re.I)
+TEAM_CLASS_RE = re.compile(r'team', re.I)
+PREDICTOR_CLASS_RE = re.compile(r'predictor', re.I)
+MATCHUP_CLASS_RE = re.compile(r'matchup', re.I)
+PROBABILITY_CLASS_RE = re.compile(r'probability', re.I)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled(selector):
+    """Compile a CSS selector once and reuse it across pages."""
+    return soupsieve.compile(selector)
+
+
+def debug_schedule_page(scraper, legacy=False):
     """Debug the schedule page structure."""
     print("=" * 80)
     print("DEBUGGING SCHEDULE PAGE")
@@ -26,88 +61,186 @@ def debug_schedule_page():
     print(f"\nURL: {url}")
     print("\nFetching page...")
     
-    with Scraper() as scraper:
+    if not legacy:
         try:
-            soup = scraper.get_soup(url)
-            print("✓ Page fetched successfully")
-            
-            # Save the full HTML for inspection
-            with open('schedule_page_debug.html', 'w', encoding='utf-8') as f:
-                f.write(soup.prettify())
-            print("✓ Saved full HTML to: schedule_page_debug.html")
-            
-            # Check for "No Data Available"
-            no_data = soup.find('div', class_='Table__NoData')
-            if no_data:
-                print("\n⚠ Found 'No Data Available' message")
-                print(f"  Content: {no_data.get_text(strip=True)}")
-            else:
-                print("\n✓ No 'No Data Available' message found")
-            
-            # Look for table body
-            print("\n--- Checking for table body ---")
-            table_body = soup.find('tbody', class_='Table__TBODY')
-            if table_body:
-                print("✓ Found <tbody class='Table__TBODY'>")
-                rows = table_body.find_all('tr')
-                print(f"  Found {len(rows)} rows")
-            else:
-                print("✗ Did not find <tbody class='Table__TBODY'>")
-                
-                # Try alternative selectors
-                print("\n--- Trying alternative selectors ---")
-                table_body = soup.find('tbody')
-                if table_body:
-                    print("✓ Found <tbody> (without specific class)")
-                    rows = table_body.find_all('tr')
-                    print(f"  Found {len(rows)} rows")
-                else:
-                    print("✗ No <tbody> found at all")
-                    
-                    # Look for any tables
-                    tables = soup.find_all('table')
-                    print(f"\nFound {len(tables)} <table> elements total")
-                    
-                    # Look for schedule container
-                    schedule_divs = soup.find_all('div', class_=lambda x: x and 'schedule' in x.lower())
-                    print(f"Found {len(schedule_divs)} divs with 'schedule' in class name")
-            
-            # Look for links that might be game links
-            print("\n--- Looking for game links ---")
-            all_links = soup.find_all('a', href=True)
-            game_links = [link for link in all_links if '/game/' in link.get('href', '')]
-            print(f"Found {len(game_links)} links containing '/game/'")
+            import selectolax  # noqa: F401
+        except ImportError:
+            print("⚠ selectolax not installed, falling back to BeautifulSoup")
+            legacy = True
+    
+    try:
+        if legacy:
+            response = scraper.get(url)
+        else:
+            # get_tree() keeps the response it parsed for the raw checks
+            tree = scraper.get_tree(url)
+            response = scraper.last_response
+        print("✓ Page fetched successfully")
+        
+        # Save the raw HTML for inspection
+        with open('schedule_page_debug.html', 'w', encoding='utf-8') as f:
+            f.write(response.text)
+        print("✓ Saved full HTML to: schedule_page_debug.html")
+        
+        # Game links only need a scan of the raw bytes, not a DOM
+        print("\n--- Looking for game links ---")
+        game_hrefs = [href.decode() for href in GAME_HREF_RE.findall(response.content)]
+        print(f"Found {len(game_hrefs)} links containing '/game/'")
+        
+        if game_hrefs:
+            print("\nFirst 5 game links:")
+            for i, href in enumerate(game_hrefs[:5], 1):
+                print(f"  {i}. {href}")
+        elif b'Table__NoData' in response.content:
+            print("\n⚠ Found 'No Data Available' message, skipping structure checks")
+            return True
+        
+        if legacy:
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SCHEDULE_STRAINER)
+            _inspect_schedule_soup(soup, response.text)
+        else:
+            _inspect_schedule_tree(tree)
+        
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    
+    return True
+
+
+def _inspect_schedule_tree(tree):
+    """Print schedule page diagnostics from a selectolax tree."""
+    # Check for "No Data Available"
+    no_data = tree.css_first('div.Table__NoData')
+    if no_data:
+        print("\n⚠ Found 'No Data Available' message")
+        print(f"  Content: {no_data.text(strip=True)}")
+    else:
+        print("\n✓ No 'No Data Available' message found")
+    
+    # Look for table body
+    print("\n--- Checking for table body ---")
+    table_body = tree.css_first('tbody.Table__TBODY')
+    if table_body:
+        print("✓ Found <tbody class='Table__TBODY'>")
+        rows = table_body.css('tr')
+        print(f"  Found {len(rows)} rows")
+    else:
+        print("✗ Did not find <tbody class='Table__TBODY'>")
+        
+        # Try alternative selectors
+        print("\n--- Trying alternative selectors ---")
+        table_body = tree.css_first('tbody')
+        if table_body:
+            print("✓ Found <tbody> (without specific class)")
+            rows = table_body.css('tr')
+            print(f"  Found {len(rows)} rows")
+        else:
+            print("✗ No <tbody> found at all")
             
-            if game_links:
-                print("\nFirst 5 game links:")
-                for i, link in enumerate(game_links[:5], 1):
-                    href = link.get('href')
-                    text = link.get_text(strip=True)
-                    print(f"  {i}. {href}")
-                    print(f"     Text: {text}")
+            # Look for any tables
+            tables = tree.css('table')
+            print(f"\nFound {len(tables)} <table> elements total")
             
-            # Look for team names
-            print("\n--- Looking for team names ---")
-            team_links = soup.find_all('a', class_=lambda x: x and 'team' in str(x).lower())
-            print(f"Found {len(team_links)} links with 'team' in class name")
+            # Look for schedule container
+            schedule_divs = [
+                div for div in tree.css('div[class]')
+                if 'schedule' in (div.attributes['class'] or '').lower()
+            ]
+            print(f"Found {len(schedule_divs)} divs with 'schedule' in class name")
+    
+    # Look for team names
+    print("\n--- Looking for team names ---")
+    team_links = [
+        link for link in tree.css('a[class]')
+        if 'team' in (link.attributes['class'] or '').lower()
+    ]
+    print(f"Found {len(team_links)} links with 'team' in class name")
+    
+    if team_links:
+        print("\nFirst 10 team links:")
+        for i, link in enumerate(team_links[:10], 1):
+            text = link.text(strip=True)
+            classes = (link.attributes['class'] or '').split()
+            print(f"  {i}. {text} (classes: {classes})")
+
+
+def _inspect_schedule_soup(soup, html):
+    """
+    Print schedule page diagnostics from a strained BeautifulSoup object.
+    
+    ``soup`` only holds the nodes kept by SCHEDULE_STRAINER; ``html`` is the
+    raw page, used for checks that need elements outside of it.
+    """
+    # Check for "No Data Available"
+    if 'Table__NoData' in html:
+        print("\n⚠ Found 'No Data Available' message")
+    else:
+        print("\n✓ No 'No Data Available' message found")
+    
+    # Collect everything in one walk over the tree
+    table_body = None
+    any_body = None
+    row_counts = {}
+    table_count = 0
+    team_links = []
+    
+    for node in soup.descendants:
+        name = getattr(node, 'name', None)
+        if name == 'tr':
+            parent = node.parent
+            if parent is not None and parent.name == 'tbody':
+                row_counts[id(parent)] = row_counts.get(id(parent), 0) + 1
+        elif name == 'a':
+            if any(TEAM_CLASS_RE.search(cls) for cls in node.get('class', [])):
+                team_links.append(node)
+        elif name == 'tbody':
+            if any_body is None:
+                any_body = node
+            if table_body is None and 'Table__TBODY' in node.get('class', []):
+                table_body = node
+        elif name == 'table':
+            table_count += 1
+    
+    # Look for table body
+    print("\n--- Checking for table body ---")
+    if table_body:
+        print("✓ Found <tbody class='Table__TBODY'>")
+        print(f"  Found {row_counts.get(id(table_body), 0)} rows")
+    else:
+        print("✗ Did not find <tbody class='Table__TBODY'>")
+        
+        # Try alternative selectors
+        print("\n--- Trying alternative selectors ---")
+        if any_body:
+            print("✓ Found <tbody> (without specific class)")
+            print(f"  Found {row_counts.get(id(any_body), 0)} rows")
+        else:
+            print("✗ No <tbody> found at all")
             
-            if team_links:
-                print("\nFirst 10 team links:")
-                for i, link in enumerate(team_links[:10], 1):
-                    text = link.get_text(strip=True)
-                    classes = link.get('class', [])
-                    print(f"  {i}. {text} (classes: {classes})")
+            # Look for any tables
+            print(f"\nFound {table_count} <table> elements total")
             
-        except Exception as e:
-            print(f"\n✗ Error: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+            # Look for schedule container (needs the unstrained page)
+            full_soup = BeautifulSoup(html, 'lxml')
+            schedule_divs = full_soup.find_all('div', class_=SCHEDULE_CLASS_RE)
+            print(f"Found {len(schedule_divs)} divs with 'schedule' in class name")
     
-    return True
+    # Look for team names
+    print("\n--- Looking for team names ---")
+    print(f"Found {len(team_links)} links with 'team' in class name")
+    
+    if team_links:
+        print("\nFirst 10 team links:")
+        for i, link in enumerate(team_links[:10], 1):
+            text = link.get_text(strip=True)
+            classes = link.get('class', [])
+            print(f"  {i}. {text} (classes: {classes})")
 
 
-def debug_game_page():
+def debug_game_page(scraper):
     """Debug a specific game page structure."""
     print("\n" + "=" * 80)
     print("DEBUGGING GAME PAGE")
@@ -119,70 +252,116 @@ def debug_game_page():
     print(f"\nURL: {url}")
     print("\nFetching page...")
     
-    with Scraper() as scraper:
-        try:
-            soup = scraper.get_soup(url)
-            print("✓ Page fetched successfully")
-            
-            # Save the full HTML for inspection
-            with open('game_page_debug.html', 'w', encoding='utf-8') as f:
-                f.write(soup.prettify())
-            print("✓ Saved full HTML to: game_page_debug.html")
-            
-            # Look for percentage values
-            print("\n--- Looking for percentages ---")
-            import re
-            
-            # Search in all text
-            all_text = soup.get_text()
-            percent_pattern = r'\d+\.?\d*%'
-            percentages = re.findall(percent_pattern, all_text)
-            print(f"Found {len(percentages)} percentage values in page text")
-            
-            if percentages:
-                print("\nAll percentages found:")
-                for i, pct in enumerate(percentages, 1):
-                    print(f"  {i}. {pct}")
-            
-            # Look for specific predictor sections
-            print("\n--- Looking for predictor sections ---")
-            
-            # Try various selectors
-            selectors = [
-                ('div', {'class': 'Gamestrip__Odds'}),
-                ('section', {'class': 'GameInfo'}),
-                ('div', {'class': lambda x: x and 'predictor' in str(x).lower()}),
-                ('div', {'class': lambda x: x and 'matchup' in str(x).lower()}),
-                ('div', {'class': lambda x: x and 'probability' in str(x).lower()}),
-            ]
-            
-            for tag, attrs in selectors:
-                elements = soup.find_all(tag, attrs)
-                class_desc = str(attrs.get('class', 'with lambda'))
-                print(f"  <{tag} class='{class_desc}'>: {len(elements)} found")
-            
-            # Look for team names
-            print("\n--- Looking for team names ---")
-            title = soup.find('title')
-            if title:
-                print(f"Page title: {title.get_text()}")
-            
-            h1_tags = soup.find_all('h1')
-            print(f"\nFound {len(h1_tags)} <h1> tags:")
-            for h1 in h1_tags[:3]:
-                print(f"  {h1.get_text(strip=True)}")
-            
-        except Exception as e:
-            print(f"\n✗ Error: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+    try:
+        response = scraper.get(url)
+        print("✓ Page fetched successfully")
+        
+        # Save the raw HTML for inspection
+        with open('game_page_debug.html', 'w', encoding='utf-8') as f:
+            f.write(response.text)
+        print("✓ Saved full HTML to: game_page_debug.html")
+        
+        # An empty shell page has nothing worth parsing
+        if b'Table__NoData' in response.content:
+            print("\n⚠ Found 'No Data Available' message, skipping page checks")
+            return True
+        
+        analysis, cached = _cached_game_analysis(response.content)
+        if cached:
+            print("✓ Reusing parse results cached for this exact page")
+        
+        # Look for percentage values
+        print("\n--- Looking for percentages ---")
+        
+        percentages = analysis['percentages']
+        print(f"Found {len(percentages)} percentage values in page source")
+        
+        if percentages:
+            print("\nAll percentages found:")
+            for i, pct in enumerate(percentages, 1):
+                print(f"  {i}. {pct}")
+        
+        # Look for specific predictor sections
+        print("\n--- Looking for predictor sections ---")
+        
+        for description, count in analysis['sections']:
+            print(f"  <{description}>: {count} found")
+        
+        # Look for team names
+        print("\n--- Looking for team names ---")
+        if analysis['title'] is not None:
+            print(f"Page title: {analysis['title']}")
+        
+        h1_texts = analysis['h1_texts']
+        print(f"\nFound {len(h1_texts)} <h1> tags:")
+        for text in h1_texts[:3]:
+            print(f"  {text}")
+        
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
     
     return True
 
 
+def _analyze_game_page(content):
+    """Run the game page diagnostics and return their results as plain data."""
+    soup = BeautifulSoup(content, 'lxml')
+    
+    # Scan the raw bytes rather than walking the tree for its text;
+    # this also picks up values embedded in scripts and attributes
+    percentages = [pct.decode() for pct in PCT_RE.findall(content)]
+    
+    sections = []
+    for selector in ('div.Gamestrip__Odds', 'section.GameInfo'):
+        sections.append((selector, len(_compiled(selector).select(soup))))
+    for class_re in (PREDICTOR_CLASS_RE, MATCHUP_CLASS_RE, PROBABILITY_CLASS_RE):
+        elements = soup.find_all('div', class_=class_re)
+        sections.append((f"div class~='{class_re.pattern}'", len(elements)))
+    
+    title = _compiled('title').select_one(soup)
+    h1_tags = _compiled('h1').select(soup)
+    
+    return {
+        'percentages': percentages,
+        'sections': sections,
+        'title': title.get_text() if title else None,
+        'h1_texts': [h1.get_text(strip=True) for h1 in h1_tags],
+    }
+
+
+def _cached_game_analysis(content):
+    """
+    Return _analyze_game_page() results, cached on disk by page content.
+    
+    Returns a tuple of the results and whether they came from the cache.
+    Bump PARSE_CACHE_VERSION after changing _analyze_game_page().
+    """
+    key = hashlib.sha1(content).hexdigest()
+    cache_path = PARSE_CACHE_DIR / f'v{PARSE_CACHE_VERSION}-{key}.pkl'
+    if cache_path.exists():
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f), True
+    
+    analysis = _analyze_game_page(content)
+    PARSE_CACHE_DIR.mkdir(exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        pickle.dump(analysis, f)
+    return analysis, False
+
+
 def main():
     """Main debug function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--legacy',
+        action='store_true',
+        help="Parse the schedule page with BeautifulSoup instead of selectolax",
+    )
+    args = parser.parse_args()
+    
     print("\n" + "=" * 80)
     print("ESPN SCRAPER DEBUG TOOL")
     print("=" * 80)
@@ -194,13 +373,15 @@ def main():
     
     success = True
     
-    # Debug schedule page
-    if not debug_schedule_page():
-        success = False
-    
-    # Debug game page
-    if not debug_game_page():
-        success = False
+    # Share one session so the game page reuses the schedule page's connection
+    with Scraper() as scraper:
+        # Debug schedule page
+        if not debug_schedule_page(scraper, legacy=args.legacy):
+            success = False
+        
+        # Debug game page
+        if not debug_game_page(scraper):
+            success = False
     
     print("\n" + "=" * 80)
     print("DEBUG COMPLETE")
@@ -6,9 +6,15 @@ This script demonstrates how to use the B1GPicks scraper to collect
 game predictor percentages for the next several days.
 """
 
+import sys
 from datetime import datetime
 from b1gpicks import Scraper
-import json
+
+try:
+    import orjson
+except ImportError:  # Fall back to the slower stdlib encoder
+    orjson = None
+    import json
 
 
 def main():
@@ -49,11 +55,11 @@ def main():
         date = day_result['date']
         games = day_result['games']
         
-        print(f"📅 {date}")
-        print("-" * 80)
+        # Build each day's block and write it in one go
+        lines = [f"📅 {date}", "-" * 80]
         
         if not games:
-            print("  No games scheduled")
+            lines.append("  No games scheduled")
         else:
             for i, game in enumerate(games, 1):
                 away = game['away_team']
@@ -61,17 +67,18 @@ def main():
                 away_pct = game.get('away_win_pct')
                 home_pct = game.get('home_win_pct')
                 
-                print(f"  {i}. {away} @ {home}")
+                lines.append(f"  {i}. {away} @ {home}")
                 
                 if away_pct is not None and home_pct is not None:
-                    print(f"     Predictor: {away} {away_pct}% | {home} {home_pct}%")
+                    lines.append(f"     Predictor: {away} {away_pct}% | {home} {home_pct}%")
                     games_with_predictors += 1
                 else:
-                    print(f"     Predictor: Not available")
+                    lines.append("     Predictor: Not available")
                 
                 total_games += 1
         
-        print()
+        lines.append("")
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     # Summary
     print("=" * 80)
@@ -87,8 +94,12 @@ def main():
     
     # Optionally save to JSON file
     output_file = f"game_predictors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(results, f, indent=2)
     
     print(f"💾 Results saved to: {output_file}")
     print()
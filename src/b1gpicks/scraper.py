@@ -1,16 +1,218 @@
 """Web scraper module with Chrome on macOS user agent."""
 
-import requests
-from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+import contextlib
+import logging
+import logging.handlers
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, BinaryIO, Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union
+from array import array
+from datetime import date, datetime, timedelta
+import functools
+import os
+import queue
+import threading
 import time
 import re
+import html
+from urllib.parse import urlparse
+
+# requests, bs4, lxml, asyncio and the process pool are imported where they
+# are used, so importing the package (e.g. just for get_schedule_url) stays
+# cheap
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    
+    import pandas
+    import requests
+    from bs4 import BeautifulSoup, SoupStrainer
+    from lxml import etree
+    from selectolax.lexbor import LexborHTMLParser
+
+# orjson decodes the large ESPN blobs several times faster; both accept bytes
+# and raise a ValueError subclass on bad input
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+logger = logging.getLogger(__name__)
+
+# Prefix for the site-relative links found on ESPN pages
+_ESPN_BASE = 'https://www.espn.com'
+
+# Marker of the script holding ESPN's embedded page JSON, and the JSON itself
+_ESPNFITT_MARKER = b"window['__espnfitt__']"
+_RE_ESPNFITT = re.compile(rb"window\['__espnfitt__'\]\s*=\s*(\{.*\})\s*;", re.DOTALL)
+
+# Patterns used when parsing game pages
+_RE_TITLE_VS = re.compile(r'(.+?)\s+(?:vs\.?|@)\s+(.+?)(?:\s+\(|$)')
+_RE_H1_AT = re.compile(r'(.+?)\s+@\s+(.+?)$')
+_RE_TITLE_RAW = re.compile(rb'<title[^>]*>(.*?)</title>', re.DOTALL | re.IGNORECASE)
+_RE_MTCHPRDCTR_RAW = re.compile(rb'"mtchpPrdctr"\s*:\s*(\{[^}]*"teams"\s*:\s*\[[^\]]+\][^}]*\})')
+_RE_NUM = re.compile(r'(\d+\.?\d*)')
+
+# XPath expressions, compiled on first use by _xpath()
+_XP_NO_DATA = "boolean(//div[contains(@class, 'Table__NoData')])"
+_XP_GAME_LINKS = "//a[contains(@href, '/game/')]"
+_XP_ROW_LINKS = "ancestor::tr[1]//a"
+_XP_PCT_NODES = (
+    "//path[@value] | //circle[@value]"
+    " | //div[contains(@class, 'matchupPredictor__teamValue')]"
+)
+
+# Largest page body read by Scraper.get_bytes
+MAX_BODY_BYTES = 4_000_000
+
+# Minimum seconds between requests to a host when no delay is given
+DEFAULT_MIN_INTERVALS = {'www.espn.com': 1.0}
+
+# Hosts with a connection pool, and connections kept per host (requests
+# defaults both to 10)
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 64
+
+# Server errors retried by urllib3 itself; 429/503 are left to
+# _retry_on_throttle so the whole host backs off
+ADAPTER_RETRY_STATUSES = (500, 502, 504)
+ADAPTER_RETRY_TOTAL = 3
+ADAPTER_RETRY_BACKOFF = 0.5
+
+# Throttled responses that get retried, and the base backoff in seconds
+RETRY_STATUSES = (429, 503)
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 1.0
+
+# On-disk HTTP cache settings, used when B1G_CACHE=1
+CACHE_NAME = '.b1gpicks_cache'
+CACHE_EXPIRE_AFTER = timedelta(hours=6)
+
+
+@functools.lru_cache(maxsize=None)
+def _title_strainer() -> 'SoupStrainer':
+    """Return the SoupStrainer keeping only the tags Scraper.scrape reads."""
+    from bs4 import SoupStrainer
+    
+    return SoupStrainer('title')
+
+
+@functools.lru_cache(maxsize=None)
+def _xpath(expression: str) -> 'etree.XPath':
+    """
+    Compile an XPath expression once and reuse it across pages.
+    
+    Args:
+        expression: XPath expression string.
+    
+    Returns:
+        Compiled lxml XPath, called with the tree or element to query.
+    """
+    from lxml import etree
+    
+    return etree.XPath(expression)
+
+
+@functools.lru_cache(maxsize=64)
+def _schedule_url(day: date, group: int) -> str:
+    """Build the ESPN schedule URL for a calendar day (memoized)."""
+    date_str = day.strftime('%Y%m%d')
+    return f"{_ESPN_BASE}/mens-college-basketball/schedule/_/date/{date_str}/group/{group}"
+
+
+def _find_script(
+    chunks: Iterable[bytes],
+    marker: bytes
+) -> Tuple[Optional[bytes], bytes]:
+    """
+    Scan raw HTML chunks until the script containing ``marker`` closes.
+    
+    Only the bytes are searched; no parse tree is built.
+    
+    Args:
+        chunks: Iterable of raw HTML byte chunks.
+        marker: Bytes identifying the wanted script.
+    
+    Returns:
+        Tuple of the script body from ``marker`` up to its closing tag (None
+        if no script matched) and the bytes consumed. Iteration stops as soon
+        as the script is found.
+    """
+    body = bytearray()
+    start = -1
+    for chunk in chunks:
+        # Resume each search just before the new chunk, in case the needle
+        # straddles the boundary
+        if start == -1:
+            scan_from = max(len(body) - len(marker), 0)
+            body += chunk
+            start = body.find(marker, scan_from)
+            scan_from = start
+        else:
+            scan_from = max(len(body) - len(b'</script>'), start)
+            body += chunk
+        if start != -1:
+            end = body.find(b'</script>', scan_from)
+            if end != -1:
+                return bytes(body[start:end]), bytes(body)
+    return None, bytes(body)
+
+
+def _retry_on_throttle(get):
+    """
+    Retry a Scraper GET with exponential backoff on 429/503 responses.
+    
+    A numeric ``Retry-After`` header takes precedence over the computed
+    backoff. The wait counts from when the throttled response arrived and
+    holds back every request to the same host that reserves a slot after it
+    (see Scraper._back_off); requests already waiting for an earlier slot
+    still go out.
+    """
+    @functools.wraps(get)
+    def wrapper(self, url: str, **kwargs):
+        import requests
+        
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                return get(self, url, **kwargs)
+            except requests.HTTPError as e:
+                response = e.response
+                if (
+                    response is None
+                    or response.status_code not in RETRY_STATUSES
+                    or attempt == RETRY_ATTEMPTS - 1
+                ):
+                    raise
+                try:
+                    wait = float(response.headers.get('Retry-After', ''))
+                except ValueError:
+                    wait = RETRY_BACKOFF * 2 ** attempt
+                # Streamed responses hold a pooled connection until closed
+                response.close()
+                self._back_off(url, wait)
+                self._throttle(url)
+    return wrapper
 
 
 class Scraper:
     """A web scraper that appears as Chrome on macOS."""
     
+    # No per-instance __dict__; subclasses that need dynamic attributes can
+    # add '__dict__' to their own __slots__
+    __slots__ = (
+        'user_agent',
+        'timeout',
+        'verbose',
+        '_session',
+        '_session_lock',
+        'last_response',
+        '_last_hit',
+        '_not_before',
+        '_min_interval',
+        '_throttle_lock',
+        '_completed_games',
+        '_parse_pool',
+    )
+    
     # Chrome on macOS user agent (updated for modern Chrome)
     DEFAULT_USER_AGENT = (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -18,22 +220,121 @@ class Scraper:
         "Chrome/120.0.0.0 Safari/537.36"
     )
     
-    def __init__(self, user_agent: Optional[str] = None, timeout: int = 30):
+    def __init__(
+        self,
+        user_agent: Optional[str] = None,
+        timeout: int = 30,
+        verbose: bool = True
+    ):
         """
         Initialize the scraper.
         
         Args:
             user_agent: Custom user agent string. Defaults to Chrome on macOS.
             timeout: Request timeout in seconds. Defaults to 30.
+            verbose: Print progress to stdout while scraping date ranges,
+                unless the application has configured logging handlers, in
+                which case progress is only logged to them. Defaults to True;
+                when False, progress is never printed.
         """
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
         self.timeout = timeout
-        self.session = requests.Session()
-        self._setup_headers()
+        self.verbose = verbose
+        self._session: Optional['requests.Session'] = None
+        self._session_lock = threading.Lock()
+        self.last_response: Optional['requests.Response'] = None
+        self._last_hit: Dict[str, float] = {}
+        self._not_before: Dict[str, float] = {}
+        self._min_interval: Dict[str, float] = dict(DEFAULT_MIN_INTERVALS)
+        self._throttle_lock = threading.Lock()
+        self._completed_games: set = set()
+        self._parse_pool: Optional['ProcessPoolExecutor'] = None
+    
+    @property
+    def parse_pool(self) -> 'ProcessPoolExecutor':
+        """Process pool for parsing game pages, started on first use."""
+        if self._parse_pool is None:
+            # Loads multiprocessing, so only imported once a pool is needed
+            from concurrent.futures import ProcessPoolExecutor
+            
+            self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._parse_pool
     
-    def _setup_headers(self) -> None:
+    @property
+    def session(self) -> 'requests.Session':
+        """
+        The HTTP session, created with its headers on first use.
+        
+        Creation happens under a lock and the session is only published once
+        fully configured, so worker threads racing on first use share one
+        session and never see it without its headers or adapters.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = self._create_session()
+                    self._setup_headers(session)
+                    self._mount_adapters(session)
+                    self._session = session
+        return self._session
+    
+    @staticmethod
+    def _create_session() -> 'requests.Session':
+        """
+        Create the HTTP session used for all requests.
+        
+        Setting the ``B1G_CACHE=1`` environment variable swaps in an on-disk
+        ``requests_cache.CachedSession`` (optional ``cache`` extra) so repeated
+        runs reuse fresh responses and revalidate stale ones with
+        ETag/Last-Modified instead of downloading them again. Expiry is
+        decided here rather than by the server's Cache-Control/Expires
+        headers, which would otherwise replace it.
+        
+        Returns:
+            A requests.Session, or a CachedSession when caching is enabled.
+        """
+        import requests
+        
+        if os.environ.get('B1G_CACHE') == '1':
+            import requests_cache
+            
+            return requests_cache.CachedSession(
+                cache_name=CACHE_NAME,
+                backend='sqlite',
+                expire_after=CACHE_EXPIRE_AFTER,
+            )
+        return requests.Session()
+    
+    @staticmethod
+    def _mount_adapters(session: 'requests.Session') -> None:
+        """
+        Mount an adapter sized for the threaded scrapers.
+        
+        Connection errors and transient 5xx responses are retried with
+        backoff inside urllib3.
+        """
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        retry = Retry(
+            total=ADAPTER_RETRY_TOTAL,
+            backoff_factor=ADAPTER_RETRY_BACKOFF,
+            status_forcelist=ADAPTER_RETRY_STATUSES,
+            # Otherwise urllib3 also retries 429/503 carrying Retry-After
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    
+    def _setup_headers(self, session: 'requests.Session') -> None:
         """Set up default headers to mimic a real browser."""
-        self.session.headers.update({
+        session.headers.update({
             'User-Agent': self.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -47,8 +348,102 @@ class Scraper:
             'Sec-Fetch-User': '?1',
             'Cache-Control': 'max-age=0',
         })
+        if hasattr(session, 'cache'):
+            # A max-age=0 request header would make the cache revalidate
+            # every response, so leave it out when caching locally
+            del session.headers['Cache-Control']
+    
+    @property
+    def is_cached(self) -> bool:
+        """Whether responses are served from the on-disk HTTP cache."""
+        return hasattr(self.session, 'cache')
     
-    def get(self, url: str, **kwargs) -> requests.Response:
+    def clear_cache(self, urls: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop responses from the on-disk HTTP cache.
+        
+        Does nothing when caching is disabled.
+        
+        Args:
+            urls: URLs whose responses should be dropped. Defaults to
+                clearing the whole cache.
+        """
+        if not self.is_cached:
+            return
+        if urls is None:
+            self.session.cache.clear()
+        else:
+            self.session.cache.delete(urls=list(urls))
+    
+    def _reserve_slot(self, url: str, min_interval: Optional[float] = None) -> float:
+        """
+        Claim the next request slot for the URL's host.
+        
+        Requests to one host start at least ``min_interval`` seconds apart
+        (the host's entry in ``_min_interval`` when not given), and no
+        earlier than a back-off set by _back_off(). The slot is recorded
+        immediately, so concurrent callers queue up behind it.
+        
+        Args:
+            url: The URL about to be requested.
+            min_interval: Minimum spacing from the previous request, in seconds.
+        
+        Returns:
+            Seconds to wait before sending the request.
+        """
+        host = urlparse(url).netloc
+        if min_interval is None:
+            min_interval = self._min_interval.get(host, 0)
+        with self._throttle_lock:
+            now = time.monotonic()
+            last_hit = self._last_hit.get(host)
+            wait = 0.0 if last_hit is None else max(0.0, last_hit + min_interval - now)
+            wait = max(wait, self._not_before.get(host, now) - now)
+            self._last_hit[host] = now + wait
+        return wait
+    
+    def _back_off(self, url: str, wait: float) -> None:
+        """
+        Keep new request slots for the URL's host at least ``wait`` seconds away.
+        
+        The wait is measured from now, e.g. from when a throttled response
+        arrived, rather than from when that request's slot was reserved.
+        
+        Args:
+            url: The URL that was throttled.
+            wait: Seconds to hold back requests to its host.
+        """
+        host = urlparse(url).netloc
+        with self._throttle_lock:
+            not_before = time.monotonic() + wait
+            if not_before > self._not_before.get(host, 0.0):
+                self._not_before[host] = not_before
+    
+    def _throttle(self, url: str, min_interval: Optional[float] = None) -> None:
+        """
+        Sleep only as long as needed to keep requests to a host spaced out.
+        
+        Unlike a fixed delay, no time is spent waiting when the previous
+        request to the host is already ``min_interval`` seconds in the past.
+        
+        Args:
+            url: The URL about to be requested.
+            min_interval: Minimum spacing from the previous request, in seconds.
+        """
+        wait = self._reserve_slot(url, min_interval)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def _athrottle(self, url: str, min_interval: Optional[float] = None) -> None:
+        """Asyncio counterpart of _throttle()."""
+        import asyncio
+        
+        wait = self._reserve_slot(url, min_interval)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    @_retry_on_throttle
+    def get(self, url: str, **kwargs) -> 'requests.Response':
         """
         Make a GET request to the specified URL.
         
@@ -65,15 +460,61 @@ class Scraper:
         kwargs.setdefault('timeout', self.timeout)
         response = self.session.get(url, **kwargs)
         response.raise_for_status()
+        self.last_response = response
         return response
     
-    def get_soup(self, url: str, parser: str = 'lxml', **kwargs) -> BeautifulSoup:
+    def get_bytes(
+        self,
+        url: str,
+        max_bytes: int = MAX_BODY_BYTES,
+        chunk_size: int = 65536,
+        **kwargs
+    ) -> bytes:
+        """
+        Download a page body as raw bytes, stopping after ``max_bytes``.
+        
+        The body is streamed and never decoded, so requests' charset
+        detection is skipped; lxml works out the encoding from the bytes.
+        
+        Args:
+            url: The URL to fetch.
+            max_bytes: Maximum number of bytes to read. Defaults to 4 MB.
+            chunk_size: Number of bytes to read per chunk.
+            **kwargs: Additional arguments to pass to get().
+        
+        Returns:
+            The (possibly truncated) response body.
+        
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        response = self.get(url, stream=True, **kwargs)
+        body = bytearray()
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                body += chunk
+                if len(body) >= max_bytes:
+                    del body[max_bytes:]
+                    break
+        finally:
+            response.close()
+        return bytes(body)
+    
+    def get_soup(
+        self,
+        url: str,
+        parser: str = 'lxml',
+        parse_only: Optional['SoupStrainer'] = None,
+        **kwargs
+    ) -> 'BeautifulSoup':
         """
         Get a BeautifulSoup object from the specified URL.
         
         Args:
             url: The URL to scrape.
             parser: The parser to use. Defaults to 'lxml'.
+            parse_only: Optional SoupStrainer; tags that don't match it are
+                discarded while parsing instead of being built into the tree.
             **kwargs: Additional arguments to pass to get().
         
         Returns:
@@ -82,10 +523,35 @@ class Scraper:
         Raises:
             requests.RequestException: If the request fails.
         """
+        from bs4 import BeautifulSoup
+        
         response = self.get(url, **kwargs)
-        return BeautifulSoup(response.content, parser)
+        return BeautifulSoup(response.content, parser, parse_only=parse_only)
     
-    def scrape(self, url: str, delay: float = 0) -> Dict[str, Any]:
+    def get_tree(self, url: str, **kwargs) -> 'LexborHTMLParser':
+        """
+        Get a selectolax Lexbor tree from the specified URL.
+        
+        Lexbor parses in C and is much faster than BeautifulSoup for
+        read-only CSS queries. Requires the optional ``selectolax`` package.
+        
+        Args:
+            url: The URL to scrape.
+            **kwargs: Additional arguments to pass to get().
+        
+        Returns:
+            LexborHTMLParser object of the page content.
+        
+        Raises:
+            ImportError: If selectolax is not installed.
+            requests.RequestException: If the request fails.
+        """
+        from selectolax.lexbor import LexborHTMLParser
+        
+        response = self.get(url, **kwargs)
+        return LexborHTMLParser(response.text)
+    
+    def scrape(self, url: str, delay: Optional[float] = None) -> Dict[str, Any]:
         """
         Scrape data from a URL.
         
@@ -93,15 +559,17 @@ class Scraper:
         
         Args:
             url: The URL to scrape.
-            delay: Optional delay before making the request (in seconds).
+            delay: Minimum time since the previous request to the same host
+                (in seconds). Defaults to the host's entry in
+                ``DEFAULT_MIN_INTERVALS``.
         
         Returns:
             Dictionary containing scraped data.
         """
-        if delay > 0:
-            time.sleep(delay)
+        self._throttle(url, delay)
         
-        soup = self.get_soup(url)
+        # Only the title is read, so skip building the rest of the tree
+        soup = self.get_soup(url, parse_only=_title_strainer())
         
         # Placeholder return - customize this for your specific needs
         return {
@@ -122,55 +590,112 @@ class Scraper:
         Returns:
             URL string for the schedule page.
         """
-        date_str = date.strftime('%Y%m%d')
-        return f"https://www.espn.com/mens-college-basketball/schedule/_/date/{date_str}/group/{group}"
+        # Drop the time of day so every call for the same day shares a cache entry
+        if isinstance(date, datetime):
+            date = date.date()
+        return _schedule_url(date, group)
+    
+    def _stream_script(
+        self,
+        url: str,
+        marker: bytes,
+        chunk_size: int = 16384
+    ) -> Tuple[Optional[bytes], bytes]:
+        """
+        Stream a page until the script containing ``marker`` closes.
+        
+        The connection is dropped as soon as the closing ``</script>`` tag
+        has arrived, so the rest of the page is never downloaded.
+        
+        Args:
+            url: The URL to fetch.
+            marker: Bytes identifying the wanted script.
+            chunk_size: Number of bytes to read per chunk.
+        
+        Returns:
+            Tuple of the script body (None if no script matched) and the bytes
+            read. The bytes hold the whole page only when no script matched.
+        
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        response = self.get(url, stream=True)
+        try:
+            return _find_script(response.iter_content(chunk_size=chunk_size), marker)
+        finally:
+            response.close()
     
-    def get_games_from_schedule(self, schedule_url: str, delay: float = 1) -> List[Dict[str, Any]]:
+    def get_games_from_schedule(self, schedule_url: str, delay: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         Extract game information from an ESPN schedule page.
         
         Args:
             schedule_url: The URL of the schedule page.
-            delay: Delay before making the request (in seconds). Defaults to 1.
+            delay: Minimum time since the previous request to the same host
+                (in seconds). Defaults to the host's entry in
+                ``DEFAULT_MIN_INTERVALS``.
         
         Returns:
             List of dictionaries containing game information (teams, game_url).
         """
-        if delay > 0:
-            time.sleep(delay)
-        
-        soup = self.get_soup(schedule_url)
-        games = []
+        self._throttle(schedule_url, delay)
         
         # ESPN embeds schedule data in a JSON blob within a script tag
-        # Look for the window['__espnfitt__'] script tag
-        import json
+        # Stream the page until the window['__espnfitt__'] script is complete
+        script, body = self._stream_script(schedule_url, _ESPNFITT_MARKER)
+        games = self._games_from_schedule_script(script) if script else None
+        
+        if games is None:
+            # Fallback: try to find games in HTML (old method). The stream
+            # stops once the script is found, so only a page read to the end
+            # can be reused; otherwise fetch it again in full.
+            if script is not None:
+                self._throttle(schedule_url, delay)
+                body = self.get_bytes(schedule_url)
+            return self._get_games_from_html(body)
         
-        scripts = soup.find_all('script')
+        return games
+    
+    def _parse_schedule_page(self, content: bytes) -> List[Dict[str, Any]]:
+        """
+        Extract game information from the full HTML of a schedule page.
+        
+        Args:
+            content: Raw HTML of the schedule page.
+        
+        Returns:
+            List of dictionaries containing game information (teams, game_url).
+        """
+        script, _ = _find_script([content], _ESPNFITT_MARKER)
+        games = self._games_from_schedule_script(script) if script else None
+        if games is None:
+            games = self._get_games_from_html(content)
+        return games
+    
+    def _games_from_schedule_script(self, script: bytes) -> Optional[List[Dict[str, Any]]]:
+        """
+        Extract games from the body of ESPN's window['__espnfitt__'] script.
+        
+        Args:
+            script: Raw bytes of the script holding the schedule JSON.
+        
+        Returns:
+            List of dictionaries containing game information, or None if the
+            script doesn't hold usable schedule data.
+        """
+        games = []
         schedule_data = None
         
-        for script in scripts:
-            if script.string and 'window[\'__espnfitt__\']' in script.string:
-                # Extract the JSON data
-                script_text = script.string
-                # Find the JSON object
-                start_idx = script_text.find('{')
-                if start_idx != -1:
-                    try:
-                        # Extract everything from first { to the end, then find matching }
-                        json_str = script_text[start_idx:]
-                        # The JSON ends before the closing script marker
-                        end_idx = json_str.rfind(';')
-                        if end_idx != -1:
-                            json_str = json_str[:end_idx]
-                        schedule_data = json.loads(json_str)
-                        break
-                    except json.JSONDecodeError:
-                        continue
+        # The JSON runs from the first { to the last }; before </script>
+        match = _RE_ESPNFITT.search(script)
+        if match:
+            try:
+                schedule_data = _json.loads(match.group(1))
+            except ValueError:
+                pass
         
         if not schedule_data:
-            # Fallback: try to find games in HTML (old method)
-            return self._get_games_from_html(soup)
+            return None
         
         # Navigate through the JSON structure to find games
         try:
@@ -178,65 +703,84 @@ class Scraper:
             schedule_content = content.get('schedule', {})
             
             # Check if there are no events
-            if not schedule_content.get('events'):
+            events = schedule_content.get('events') or []
+            if not events:
                 return games
             
-            # Extract game information from events
-            for event in schedule_content.get('events', []):
+            # Extract game information from events, once per game
+            seen = set()
+            append = games.append
+            for event in events:
                 competitors = event.get('competitors', [])
                 if len(competitors) < 2:
                     continue
                 
                 # Determine away and home teams
-                away_team = None
-                home_team = None
-                
-                for competitor in competitors:
-                    team_name = competitor.get('displayName', competitor.get('name', ''))
-                    is_home = competitor.get('isHome', False)
-                    
-                    if is_home:
-                        home_team = team_name
-                    else:
-                        away_team = team_name
+                by_home = {
+                    bool(c.get('isHome')): c.get('displayName') or c.get('name', '')
+                    for c in competitors
+                }
+                home_team, away_team = by_home.get(True), by_home.get(False)
                 
                 # Get game URL
                 game_link = event.get('link', '')
                 if game_link and not game_link.startswith('http'):
-                    game_link = f"https://www.espn.com{game_link}"
+                    game_link = _ESPN_BASE + game_link
                 
-                if away_team and home_team and game_link:
-                    games.append({
+                if away_team and home_team and game_link and game_link not in seen:
+                    seen.add(game_link)
+                    # A finished game's page never changes again
+                    status = event.get('status') or {}
+                    if event.get('completed') or status.get('state') == 'post':
+                        self._completed_games.add(game_link)
+                    append({
                         'away_team': away_team,
                         'home_team': home_team,
                         'game_url': game_link
                     })
         
-        except (KeyError, TypeError, AttributeError) as e:
-            # If JSON parsing fails, try HTML fallback
-            return self._get_games_from_html(soup)
+        except (KeyError, TypeError, AttributeError):
+            # If JSON parsing fails, let the caller try the HTML fallback
+            return None
         
         return games
     
-    def _get_games_from_html(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _get_games_from_html(self, content: bytes) -> List[Dict[str, Any]]:
         """
         Fallback method to extract games from HTML table structure.
         
+        Uses lxml XPath queries, which run in libxml2 rather than iterating
+        over every link in Python.
+        
         Args:
-            soup: BeautifulSoup object of the schedule page.
+            content: Raw HTML of the schedule page.
         
         Returns:
             List of dictionaries containing game information.
         """
         games = []
         
+        # Without any game link there is nothing to parse for
+        if b'/game/' not in content:
+            return games
+        
+        import lxml.html
+        from lxml import etree
+        
+        try:
+            tree = lxml.html.fromstring(content)
+        except etree.ParserError:
+            # Empty document
+            return games
+        
         # Check if there's no data available
-        no_data = soup.find('div', class_='Table__NoData')
-        if no_data:
+        if _xpath(_XP_NO_DATA)(tree):
             return games
         
         # Find all game links
-        game_links = soup.find_all('a', href=lambda x: x and '/game/' in x)
+        game_links = _xpath(_XP_GAME_LINKS)(tree)
+        row_links = _xpath(_XP_ROW_LINKS)
+        seen = set()
         
         for link in game_links:
             game_url = link.get('href', '')
@@ -244,17 +788,21 @@ class Scraper:
                 continue
                 
             if not game_url.startswith('http'):
-                game_url = f"https://www.espn.com{game_url}"
+                game_url = _ESPN_BASE + game_url
+            
+            # A row can link to the same game more than once
+            if game_url in seen:
+                continue
             
             # Try to find team names near this link
             # This is a best-effort attempt
-            parent = link.find_parent('tr')
-            if parent:
+            all_links = row_links(link)
+            if all_links:
                 # Look for any text that might be team names
-                all_links = parent.find_all('a')
-                team_names = [a.get_text(strip=True) for a in all_links if a.get_text(strip=True)]
+                team_names = [a.text_content().strip() for a in all_links if a.text_content().strip()]
                 
                 if len(team_names) >= 2:
+                    seen.add(game_url)
                     games.append({
                         'away_team': team_names[0],
                         'home_team': team_names[1],
@@ -263,232 +811,610 @@ class Scraper:
         
         return games
     
-    def get_game_predictor(self, game_url: str, delay: float = 1) -> Optional[Dict[str, Any]]:
+    def get_game_predictor(self, game_url: str, delay: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Extract game predictor percentages from an ESPN game page.
         
+        With the HTTP cache enabled, pages of games the schedule reported as
+        finished are cached without expiry.
+        
         Args:
             game_url: The URL of the game page.
-            delay: Delay before making the request (in seconds). Defaults to 1.
+            delay: Minimum time since the previous request to the same host
+                (in seconds). Defaults to the host's entry in
+                ``DEFAULT_MIN_INTERVALS``.
         
         Returns:
             Dictionary with team names and win percentages, or None if not available.
         """
-        if delay > 0:
-            time.sleep(delay)
+        self._throttle(game_url, delay)
         
-        soup = self.get_soup(game_url)
-        percentages = []
-        team_names = []
+        kwargs = {}
+        if self.is_cached and game_url in self._completed_games:
+            # A per-request expire_after would be sent upstream as a
+            # Cache-Control header, so re-save the response instead
+            kwargs['hooks'] = {'response': self._keep_cached}
+        return self._parse_game_predictor(self.get_bytes(game_url, **kwargs))
+    
+    def _keep_cached(self, response: 'requests.Response', *args, **kwargs) -> None:
+        """
+        Response hook that re-saves a cached response without expiry.
         
-        # Method 1 (PRIORITY): Look for SVG elements with value attributes 
-        # ESPN uses this for predictor circles on the game page
-        svg_elements = soup.find_all(['path', 'circle'], value=True)
-        for elem in svg_elements:
-            value = elem.get('value', '')
-            try:
-                pct = float(value)
-                if 0 <= pct <= 100:
-                    percentages.append(pct)
-            except ValueError:
-                continue
+        requests also runs the hook on the raw response before it is cached;
+        that one has no cache key and is skipped.
+        """
+        cache_key = getattr(response, 'cache_key', None)
+        cache = self.session.cache
+        if cache_key and response.expires is not None and cache.contains(key=cache_key):
+            cache.save_response(response, cache_key, expires=None)
+    
+    @staticmethod
+    def _parse_game_predictor(content: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Extract game predictor percentages from the HTML of a game page.
         
-        # Method 2: Look within matchupPredictor div for percentages
-        if len(percentages) < 2:
-            predictor_div = soup.find('div', class_=re.compile(r'matchupPredictor'))
-            if predictor_div:
-                percent_elements = predictor_div.find_all(string=re.compile(r'\d+\.?\d*%'))
-                for elem in percent_elements:
-                    match = re.search(r'(\d+\.?\d*)%', str(elem))
-                    if match:
-                        try:
-                            pct = float(match.group(1))
-                            if 0 <= pct <= 100:
-                                percentages.append(pct)
-                        except ValueError:
-                            continue
-        
-        # Extract team names from the page title
+        Args:
+            content: Raw HTML of the game page.
+        
+        Returns:
+            Dictionary with team names and win percentages, or None if not available.
+        """
+        # Extract team names from the page title, read straight off the bytes
+        # Format is usually "Team1 vs. Team2" or "Team1 @ Team2"
         team_names = []
-        title = soup.find('title')
-        if title:
-            title_text = title.get_text()
-            # Format is usually "Team1 vs. Team2" or "Team1 @ Team2"
-            match = re.search(r'(.+?)\s+(?:vs\.?|@)\s+(.+?)(?:\s+\(|$)', title_text)
+        title_match = _RE_TITLE_RAW.search(content)
+        if title_match:
+            title_text = html.unescape(title_match.group(1).decode('utf-8', 'replace'))
+            match = _RE_TITLE_VS.search(title_text)
             if match:
                 team_names = [match.group(1).strip(), match.group(2).strip()]
         
+        # Method 1: the mtchpPrdctr JSON (most reliable) needs no parse at all
+        if team_names:
+            result = Scraper._extract_from_mtchpprdctr_json(content, team_names)
+            if result is not None:
+                return result
+        
+        from lxml import etree
+        
+        tree = etree.HTML(content)
+        if tree is None:
+            return None
+        
         # Alternative: look for h1 tag
         if not team_names:
-            h1 = soup.find('h1')
-            if h1:
-                h1_text = h1.get_text()
-                match = re.search(r'(.+?)\s+@\s+(.+?)$', h1_text)
+            h1 = tree.find('.//h1')
+            if h1 is not None:
+                h1_text = ''.join(h1.itertext())
+                match = _RE_H1_AT.search(h1_text)
                 if match:
                     team_names = [match.group(1).strip(), match.group(2).strip()]
+            
+            result = Scraper._extract_from_mtchpprdctr_json(content, team_names)
+            if result is not None:
+                return result
         
-        # Method 1: Look for mtchpPrdctr JSON data (most reliable)
-        import json
-        scripts = soup.find_all('script')
-        for script in scripts:
-            if script.string and 'mtchpPrdctr' in script.string:
-                try:
-                    # Extract the JSON object containing mtchpPrdctr
-                    script_text = script.string
-                    # Find mtchpPrdctr section
-                    mtch_match = re.search(r'"mtchpPrdctr"\s*:\s*(\{[^}]*"teams"\s*:\s*\[[^\]]+\][^}]*\})', script_text)
-                    if mtch_match:
-                        mtch_json_str = mtch_match.group(1)
-                        mtch_data = json.loads(mtch_json_str)
-                        teams = mtch_data.get('teams', [])
+        # Fallback: the predictor chart markup
+        return Scraper._extract_from_markup(tree, team_names)
+    
+    @staticmethod
+    def _predictor_result(
+        team_names: List[str],
+        away_pct: float,
+        home_pct: float
+    ) -> Dict[str, Any]:
+        """Build the predictor dictionary for an "Away @ Home" pair of names."""
+        return {
+            'away_team': team_names[0],
+            'home_team': team_names[1],
+            'away_win_pct': away_pct,
+            'home_win_pct': home_pct
+        }
+    
+    @staticmethod
+    def _extract_from_mtchpprdctr_json(
+        content: bytes,
+        team_names: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read win percentages from the mtchpPrdctr JSON embedded in a script.
+        
+        The JSON is matched directly in the raw page bytes, so no parse tree
+        is needed.
+        
+        Args:
+            content: Raw HTML of the game page.
+            team_names: Away and home team names, possibly empty.
+        
+        Returns:
+            Predictor dictionary, or None if the JSON is missing or incomplete.
+        """
+        if len(team_names) != 2:
+            return None
+        
+        for mtch_match in _RE_MTCHPRDCTR_RAW.finditer(content):
+            try:
+                mtch_data = _json.loads(mtch_match.group(1))
+                teams = mtch_data.get('teams', [])
+                
+                if len(teams) >= 2:
+                    # Extract percentages and determine which team is which
+                    away_pct = None
+                    home_pct = None
+                    
+                    for team in teams:
+                        pct = team.get('value') or team.get('percentage')
+                        is_home = team.get('isHome', False)
                         
-                        if len(teams) >= 2:
-                            # Extract percentages and determine which team is which
-                            away_pct = None
-                            home_pct = None
-                            
-                            for team in teams:
-                                pct = team.get('value') or team.get('percentage')
-                                is_home = team.get('isHome', False)
-                                
-                                if pct is not None:
-                                    if is_home:
-                                        home_pct = float(pct)
-                                    else:
-                                        away_pct = float(pct)
-                            
-                            if away_pct is not None and home_pct is not None and len(team_names) == 2:
-                                return {
-                                    'away_team': team_names[0],
-                                    'home_team': team_names[1],
-                                    'away_win_pct': away_pct,
-                                    'home_win_pct': home_pct
-                                }
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    continue
+                        if pct is not None:
+                            if is_home:
+                                home_pct = float(pct)
+                            else:
+                                away_pct = float(pct)
+                    
+                    if away_pct is not None and home_pct is not None:
+                        return Scraper._predictor_result(team_names, away_pct, home_pct)
+            except (KeyError, ValueError):
+                continue
         
-        # Method 2: Look for matchupPredictor divs with specific classes
-        predictor_divs = soup.find_all('div', class_=re.compile(r'matchupPredictor__teamValue'))
-        percentages = []
+        return None
+    
+    @staticmethod
+    def _extract_from_markup(
+        tree: 'etree._Element',
+        team_names: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read win percentages from the predictor chart markup.
         
-        for div in predictor_divs:
-            # Get the text content and look for numbers
-            text = div.get_text()
-            match = re.search(r'(\d+\.?\d*)', text)
-            if match:
-                try:
-                    pct = float(match.group(1))
-                    if 0 <= pct <= 100:
-                        percentages.append(pct)
-                except ValueError:
-                    continue
+        One XPath union returns the SVG ``path``/``circle`` nodes carrying a
+        ``value`` attribute and the matchupPredictor team value divs in
+        document order, and the scan stops at the second valid percentage.
         
-        # Method 3: Look for SVG path elements with value attribute in predictor section
-        if len(percentages) < 2:
-            svg_paths = soup.find_all('path', value=True)
-            for path in svg_paths:
-                value = path.get('value', '')
-                try:
-                    pct = float(value)
-                    if 0 <= pct <= 100:
-                        percentages.append(pct)
-                except ValueError:
-                    continue
+        Args:
+            tree: Parsed game page.
+            team_names: Away and home team names, possibly empty.
         
-        # If we found exactly 2 percentages and team names
-        if len(percentages) >= 2 and len(team_names) == 2:
-            # ESPN's SVG path elements are in order: home team first, away team second
-            # But team_names from title are in "Away @ Home" format
-            # So percentages[0] = home team, percentages[1] = away team
-            return {
-                'away_team': team_names[0],
-                'home_team': team_names[1],
-                'away_win_pct': percentages[0],
-                'home_win_pct': percentages[1]
-            }
+        Returns:
+            Predictor dictionary, or None if fewer than two values are found.
+        """
+        if len(team_names) != 2:
+            return None
+        
+        percentages = []
+        search_num = _RE_NUM.search
+        for node in _xpath(_XP_PCT_NODES)(tree):
+            if node.tag == 'div':
+                # Get the text content and look for numbers
+                match = search_num(''.join(node.itertext()))
+                if not match:
+                    continue
+                value = match.group(1)
+            else:
+                value = node.get('value')
+            try:
+                pct = float(value)
+            except ValueError:
+                continue
+            if 0 <= pct <= 100:
+                percentages.append(pct)
+                if len(percentages) == 2:
+                    # Kept in page order: the first value belongs to the
+                    # away team listed first in the title
+                    return Scraper._predictor_result(team_names, percentages[0], percentages[1])
         
         return None
     
+    @contextlib.contextmanager
+    def _progress_log(self) -> Iterator[None]:
+        """
+        Print this thread's INFO progress messages to stdout while active.
+        
+        Does nothing unless the scraper is verbose; see _ProgressPrinter.
+        """
+        if not self.verbose:
+            yield
+            return
+        with _progress_printer.active():
+            yield
+    
+    def iter_games_with_predictors(
+        self,
+        start_date: Optional[datetime] = None,
+        num_days: int = 3,
+        delay_between_pages: Optional[float] = None,
+        delay_between_games: Optional[float] = None,
+        max_workers: int = 8
+    ) -> Iterator[Tuple[str, int, Dict[str, Any]]]:
+        """
+        Yield game predictor data for multiple days as soon as it is ready.
+        
+        Schedule pages and game pages share one thread pool. A day's game
+        pages are queued as soon as its schedule is parsed, so they overlap
+        with the remaining schedule fetches, and games are yielded in the
+        order their predictors finish. Requests to ESPN are still started
+        at least the given delay apart, and a game listed on more than one
+        day is only fetched once.
+        
+        Args:
+            start_date: Starting date (defaults to today).
+            num_days: Number of days to scrape (defaults to 3).
+            delay_between_pages: Delay between schedule page requests.
+            delay_between_games: Delay between individual game page requests.
+                Both default to the host's entry in ``DEFAULT_MIN_INTERVALS``.
+            max_workers: Maximum number of concurrent requests (defaults to 8).
+        
+        Yields:
+            Tuples of the date ('YYYY-MM-DD'), the game's position on that
+            day's schedule, and its game data.
+        """
+        if start_date is None:
+            start_date = datetime.now()
+        
+        dates = [start_date + timedelta(days=day_offset) for day_offset in range(num_days)]
+        
+        def fetch_games(date: datetime) -> List[Dict[str, Any]]:
+            return self.get_games_from_schedule(self.get_schedule_url(date), delay=delay_between_pages)
+        
+        def fetch_predictor(game: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return self.get_game_predictor(game['game_url'], delay=delay_between_games)
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            schedules = {executor.submit(fetch_games, date): date for date in dates}
+            # Schedule entries waiting on each game page, keyed by its future
+            waiting: Dict[Future, List[Tuple[str, int, Dict[str, Any]]]] = {}
+            submitted: Dict[str, Future] = {}
+            
+            while schedules or waiting:
+                done, _ = wait([*schedules, *waiting], return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in schedules:
+                        date_str = schedules.pop(future).strftime('%Y-%m-%d')
+                        for i, game in enumerate(future.result()):
+                            game_future = submitted.get(game['game_url'])
+                            if game_future is None:
+                                game_future = executor.submit(fetch_predictor, game)
+                                submitted[game['game_url']] = game_future
+                            if game_future.done() and game_future not in waiting:
+                                # Nothing is waiting on it any more, so report it now
+                                yield date_str, i, self._build_game_data(game, game_future.result())
+                            else:
+                                waiting.setdefault(game_future, []).append((date_str, i, game))
+                    else:
+                        predictor = future.result()
+                        for date_str, i, game in waiting.pop(future):
+                            yield date_str, i, self._build_game_data(game, predictor)
+        finally:
+            executor.shutdown(cancel_futures=True)
+    
     def scrape_games_by_date_range(
         self,
         start_date: Optional[datetime] = None,
         num_days: int = 3,
-        delay_between_pages: float = 1,
-        delay_between_games: float = 1
-    ) -> List[Dict[str, Any]]:
+        delay_between_pages: Optional[float] = None,
+        delay_between_games: Optional[float] = None,
+        max_workers: int = 8,
+        return_columnar: bool = False,
+        out_path: Optional[str] = None
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any], 'pandas.DataFrame']:
         """
         Scrape game predictor data for multiple days.
         
+        Collects iter_games_with_predictors(), logging each game as its
+        predictor arrives (printed when the scraper is verbose). The results
+        keep date and schedule order.
+        
+        With ``out_path``, games are not kept in memory. Each one is instead
+        appended to that file as a JSON line (its date plus game data) by a
+        background writer thread, in the order the predictors arrive, which
+        keeps memory flat for long backfills.
+        
         Args:
             start_date: Starting date (defaults to today).
             num_days: Number of days to scrape (defaults to 3).
             delay_between_pages: Delay between schedule page requests.
             delay_between_games: Delay between individual game page requests.
+                Both default to the host's entry in ``DEFAULT_MIN_INTERVALS``.
+            max_workers: Maximum number of concurrent requests (defaults to 8).
+            return_columnar: Return one column per field instead of the
+                default per-day list of game dictionaries (see
+                _new_columns()). Defaults to False.
+            out_path: File to append JSON lines to instead of returning the
+                games. Takes precedence over return_columnar.
         
         Returns:
-            List of dictionaries containing date, teams, and predictor data.
+            List of dictionaries containing date, teams, and predictor data,
+            or the columnar form when return_columnar is set. With out_path,
+            a summary dictionary with the path and the number of days and
+            games written.
         """
         if start_date is None:
             start_date = datetime.now()
         
-        all_results = []
+        days: Dict[str, Dict[int, Dict[str, Any]]] = {
+            (start_date + timedelta(days=day_offset)).strftime('%Y-%m-%d'): {}
+            for day_offset in range(num_days)
+        }
         
-        for day_offset in range(num_days):
-            current_date = start_date + timedelta(days=day_offset)
-            date_str = current_date.strftime('%Y-%m-%d')
+        with self._progress_log():
+            records: Optional[queue.Queue] = None
+            writer_errors: List[BaseException] = []
+            if out_path is not None:
+                # Opened here so a bad path fails before any scraping starts
+                out_file = open(out_path, 'ab', buffering=1 << 20)
+                records = queue.Queue()
+                writer = threading.Thread(
+                    target=_write_jsonl, args=(records, out_file, writer_errors), daemon=True
+                )
+                writer.start()
+            counts = dict.fromkeys(days, 0)
+            columns: Optional[Dict[str, Any]] = None
+            order: List[Tuple[str, int]] = []
+            if return_columnar and records is None:
+                columns = self._new_columns()
             
-            print(f"Scraping games for {date_str}...")
+            try:
+                for date_str, i, game_data in self.iter_games_with_predictors(
+                    start_date, num_days, delay_between_pages, delay_between_games, max_workers
+                ):
+                    if writer_errors:
+                        break
+                    counts[date_str] += 1
+                    if records is not None:
+                        records.put({'date': date_str, **game_data})
+                    elif columns is not None:
+                        # Rows arrive as predictors finish; order keeps the
+                        # (date, schedule index) key of each to sort them by
+                        self._append_row(columns, date_str, game_data)
+                        order.append((date_str, i))
+                    else:
+                        days[date_str][i] = game_data
+                    if game_data['away_win_pct'] is not None:
+                        logger.info(
+                            "  %s %s @ %s: %s %s%%, %s %s%%",
+                            date_str, game_data['away_team'], game_data['home_team'],
+                            game_data['away_team'], game_data['away_win_pct'],
+                            game_data['home_team'], game_data['home_win_pct'],
+                        )
+                    else:
+                        logger.info(
+                            "  %s %s @ %s: predictor not available",
+                            date_str, game_data['away_team'], game_data['home_team'],
+                        )
+            finally:
+                if records is not None:
+                    # Let the writer drain the queue, then close the file
+                    records.put(None)
+                    writer.join()
+                    out_file.close()
             
-            # Get schedule URL and extract games
-            schedule_url = self.get_schedule_url(current_date)
-            games = self.get_games_from_schedule(schedule_url, delay=delay_between_pages)
+            if writer_errors:
+                raise writer_errors[0]
             
-            if not games:
-                print(f"  No games found for {date_str}")
-                all_results.append({
-                    'date': date_str,
-                    'games': []
-                })
-                continue
+            for date_str, count in counts.items():
+                if not count:
+                    logger.info("  No games found for %s", date_str)
             
-            print(f"  Found {len(games)} games")
+            if out_path is not None:
+                return {'path': out_path, 'days': len(counts), 'games': sum(counts.values())}
+            if columns is not None:
+                return self._sorted_columns(columns, order)
+            return [
+                {'date': date_str, 'games': [games[i] for i in sorted(games)]}
+                for date_str, games in days.items()
+            ]
+    
+    @staticmethod
+    def _new_columns() -> Dict[str, Any]:
+        """
+        Create empty columns for the columnar scrape results.
+        
+        Win percentages are stored as ``array('d')`` with NaN for games
+        without a predictor.
+        
+        Returns:
+            Dictionary mapping each field to its empty column.
+        """
+        return {
+            'date': [],
+            'away_team': [],
+            'home_team': [],
+            'game_url': [],
+            'away_win_pct': array('d'),
+            'home_win_pct': array('d'),
+        }
+    
+    @staticmethod
+    def _append_row(columns: Dict[str, Any], date_str: str, game: Dict[str, Any]) -> None:
+        """
+        Append one game to columns made by _new_columns().
+        
+        Args:
+            columns: Columns to extend.
+            date_str: Date of the game (YYYY-MM-DD).
+            game: Game data from _build_game_data().
+        """
+        columns['date'].append(date_str)
+        for key in ('away_team', 'home_team', 'game_url'):
+            columns[key].append(game[key])
+        for key in ('away_win_pct', 'home_win_pct'):
+            columns[key].append(float('nan') if game[key] is None else game[key])
+    
+    @staticmethod
+    def _sorted_columns(
+        columns: Dict[str, Any],
+        order: List[Tuple[str, int]]
+    ) -> Union[Dict[str, Any], 'pandas.DataFrame']:
+        """
+        Put columns filled in arrival order into date and schedule order.
+        
+        Args:
+            columns: Columns filled by _append_row().
+            order: (date, schedule index) key of each row, in arrival order.
+        
+        Returns:
+            A pandas DataFrame when pandas is installed (optional ``pandas``
+            extra), otherwise the dictionary of columns.
+        """
+        rows = sorted(range(len(order)), key=order.__getitem__)
+        for key, column in columns.items():
+            reordered = [column[row] for row in rows]
+            columns[key] = array('d', reordered) if isinstance(column, array) else reordered
+        
+        try:
+            import pandas
+        except ImportError:
+            return columns
+        return pandas.DataFrame(columns)
+    
+    async def scrape_games_by_date_range_async(
+        self,
+        start_date: Optional[datetime] = None,
+        num_days: int = 3,
+        delay_between_pages: Optional[float] = None,
+        delay_between_games: Optional[float] = None,
+        max_concurrency: int = 4,
+        parse_in_processes: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape game predictor data for multiple days with asyncio.
+        
+        All schedule pages, and then each day's game pages, are requested
+        concurrently through one ``httpx.AsyncClient`` speaking HTTP/2, so
+        game pages are multiplexed over a single connection. At most
+        ``max_concurrency`` requests are in flight at once. Pages are parsed
+        on the default thread pool, never on the event loop; with
+        ``parse_in_processes`` game pages go to the scraper's process pool
+        (see parse_pool) instead. Requires the optional ``async`` extra
+        (``httpx[http2]``).
+        
+        Args:
+            start_date: Starting date (defaults to today).
+            num_days: Number of days to scrape (defaults to 3).
+            delay_between_pages: Delay between schedule page requests.
+            delay_between_games: Delay between individual game page requests.
+                Both default to the host's entry in ``DEFAULT_MIN_INTERVALS``.
+            max_concurrency: Maximum number of requests in flight (defaults to 4).
+            parse_in_processes: Parse game pages in worker processes, which
+                unlike threads run in parallel despite the GIL. Under the
+                ``spawn`` start method (macOS, Windows) the calling script
+                must guard its entry point with ``if __name__ == '__main__':``.
+                Defaults to False.
+        
+        Returns:
+            List of dictionaries containing date, teams, and predictor data,
+            in the same format as scrape_games_by_date_range().
+        
+        Raises:
+            ImportError: If httpx (with HTTP/2 support) is not installed.
+            httpx.HTTPError: If a request fails.
+        """
+        import asyncio
+        
+        import httpx
+        
+        if start_date is None:
+            start_date = datetime.now()
+        
+        dates = [start_date + timedelta(days=day_offset) for day_offset in range(num_days)]
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Connection-specific headers are not allowed over HTTP/2
+        headers = {
+            name: value for name, value in self.session.headers.items()
+            if name.lower() != 'connection'
+        }
+        
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=8),
+            follow_redirects=True,
+        ) as client:
             
-            # Get predictor data for each game
-            games_with_predictors = []
-            for game in games:
-                matchup = f"{game['away_team']} @ {game['home_team']}"
-                print(f"    Fetching predictor for {matchup}...")
-                
-                predictor = self.get_game_predictor(game['game_url'], delay=delay_between_games)
+            async def fetch(url: str, delay: Optional[float]) -> bytes:
+                async with semaphore:
+                    await self._athrottle(url, delay)
+                    response = await client.get(url)
+                response.raise_for_status()
+                return response.content
+            
+            # Parsing is CPU-bound, so keep it off the event loop to let
+            # other responses stream in meanwhile
+            parse_executor = self.parse_pool if parse_in_processes else None
+            
+            async def predict(game_url: str) -> Optional[Dict[str, Any]]:
+                body = await fetch(game_url, delay_between_games)
+                return await loop.run_in_executor(parse_executor, _parse_predictor_bytes, body)
+            
+            # Every task is tracked so a failure can stop the others
+            tasks: List[asyncio.Task] = []
+            
+            def spawn(coroutine) -> asyncio.Task:
+                task = asyncio.ensure_future(coroutine)
+                tasks.append(task)
+                return task
+            
+            # A game listed on more than one day is only fetched once
+            predictions: Dict[str, asyncio.Task] = {}
+            
+            async def fetch_predictor(game: Dict[str, Any]) -> Dict[str, Any]:
+                game_url = game['game_url']
+                if game_url not in predictions:
+                    predictions[game_url] = spawn(predict(game_url))
+                return self._build_game_data(game, await predictions[game_url])
+            
+            async def scrape_day(date: datetime) -> Dict[str, Any]:
+                body = await fetch(self.get_schedule_url(date), delay_between_pages)
+                games = await loop.run_in_executor(None, self._parse_schedule_page, body)
                 
-                game_data = {
-                    'away_team': game['away_team'],
-                    'home_team': game['home_team'],
-                    'game_url': game['game_url']
+                return {
+                    'date': date.strftime('%Y-%m-%d'),
+                    'games': list(await asyncio.gather(*(spawn(fetch_predictor(game)) for game in games)))
                 }
-                
-                if predictor:
-                    game_data['away_win_pct'] = predictor['away_win_pct']
-                    game_data['home_win_pct'] = predictor['home_win_pct']
-                    print(f"      {game['away_team']}: {predictor['away_win_pct']}%, "
-                          f"{game['home_team']}: {predictor['home_win_pct']}%")
-                else:
-                    game_data['away_win_pct'] = None
-                    game_data['home_win_pct'] = None
-                    print(f"      Predictor not available")
-                
-                games_with_predictors.append(game_data)
             
-            all_results.append({
-                'date': date_str,
-                'games': games_with_predictors
-            })
+            try:
+                return list(await asyncio.gather(*(spawn(scrape_day(date)) for date in dates)))
+            finally:
+                # gather() leaves the other tasks running when one fails;
+                # stop them before the client closes under them
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+    
+    @staticmethod
+    def _build_game_data(
+        game: Dict[str, Any],
+        predictor: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Combine a schedule entry with its predictor result.
         
-        return all_results
+        Args:
+            game: Game dictionary from get_games_from_schedule().
+            predictor: Result of get_game_predictor(), or None.
+        
+        Returns:
+            Dictionary with teams, game URL and win percentages (None when
+            the predictor is not available).
+        """
+        return {
+            'away_team': game['away_team'],
+            'home_team': game['home_team'],
+            'game_url': game['game_url'],
+            'away_win_pct': predictor['away_win_pct'] if predictor else None,
+            'home_win_pct': predictor['home_win_pct'] if predictor else None,
+        }
     
     def close(self) -> None:
-        """Close the session."""
-        self.session.close()
+        """Close the session and stop the parse process pool."""
+        if self._session is not None:
+            self._session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
     
     def __enter__(self):
         """Context manager entry."""
@@ -498,3 +1424,117 @@ class Scraper:
         """Context manager exit."""
         self.close()
 
+
+class _ProgressPrinter:
+    """
+    Print this module's INFO records to stdout for verbose scrapes.
+    
+    Records are only put on an in-memory queue by a QueueHandler; a
+    QueueListener thread formats and writes them, so stdout never
+    serialises the fetch loop. One handler and listener are shared by all
+    scrapes running at once, and only records logged from a thread inside
+    active() are printed, so a concurrent non-verbose scrape stays quiet.
+    Nothing is attached if the application has configured logging handlers
+    itself, and the logger's level is only raised to INFO while it is
+    unset.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._threads: Dict[int, int] = {}
+        self._handler: Optional[logging.Handler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._raised_level = False
+    
+    def _filter(self, record: logging.LogRecord) -> bool:
+        return record.thread in self._threads
+    
+    def _start(self) -> None:
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        stdout = logging.StreamHandler(sys.stdout)
+        stdout.setFormatter(logging.Formatter('%(message)s'))
+        self._handler = logging.handlers.QueueHandler(records)
+        self._handler.addFilter(self._filter)
+        self._listener = logging.handlers.QueueListener(records, stdout)
+        logger.addHandler(self._handler)
+        if logger.level == logging.NOTSET:
+            logger.setLevel(logging.INFO)
+            self._raised_level = True
+        self._listener.start()
+    
+    def _stop(self) -> None:
+        self._listener.stop()
+        logger.removeHandler(self._handler)
+        if self._raised_level:
+            logger.setLevel(logging.NOTSET)
+            self._raised_level = False
+        self._handler = self._listener = None
+    
+    @contextlib.contextmanager
+    def active(self) -> Iterator[None]:
+        """Print records logged by the current thread until exit."""
+        thread = threading.get_ident()
+        with self._lock:
+            if self._listener is None:
+                if logger.hasHandlers():
+                    # The application's own handlers get the records
+                    attached = False
+                else:
+                    self._start()
+                    attached = True
+            else:
+                attached = True
+            if attached:
+                self._threads[thread] = self._threads.get(thread, 0) + 1
+        try:
+            yield
+        finally:
+            if attached:
+                with self._lock:
+                    self._threads[thread] -= 1
+                    if not self._threads[thread]:
+                        del self._threads[thread]
+                    if not self._threads:
+                        self._stop()
+
+
+_progress_printer = _ProgressPrinter()
+
+
+def _write_jsonl(
+    records: 'queue.Queue[Optional[Dict[str, Any]]]',
+    out_file: BinaryIO,
+    errors: List[BaseException]
+) -> None:
+    """
+    Write records from a queue to a JSON Lines file until None arrives.
+    
+    Runs on scrape_games_by_date_range's writer thread, so only one thread
+    ever writes to the file. A failure is appended to ``errors`` for the
+    calling thread to re-raise, and the rest of the queue is drained
+    without writing so it cannot keep growing.
+    
+    Args:
+        records: Queue of JSON-serialisable dictionaries, ended by None.
+        out_file: File opened for binary appending; the caller closes it.
+        errors: List receiving the exception that stopped the writer.
+    """
+    while (record := records.get()) is not None:
+        if errors:
+            continue
+        try:
+            line = _json.dumps(record)
+            # orjson produces bytes, the stdlib json module a str
+            out_file.write((line if isinstance(line, bytes) else line.encode()) + b'\n')
+        except Exception as e:
+            errors.append(e)
+
+
+def _parse_predictor_bytes(content: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse a game page in a worker process.
+    
+    A module-level function so ProcessPoolExecutor can pickle it; see
+    Scraper._parse_game_predictor.
+    """
+    return Scraper._parse_game_predictor(content)
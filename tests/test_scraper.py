@@ -1,8 +1,61 @@
 """Tests for the scraper module."""
 
+import asyncio
+import json
 import pytest
 from datetime import datetime
 from b1gpicks import Scraper
+from b1gpicks.scraper import DEFAULT_MIN_INTERVALS, _find_script, _xpath
+
+
+SCHEDULE_DATA = {
+    'page': {'content': {'schedule': {'events': [
+        {
+            'link': '/mens-college-basketball/game/_/gameId/401827278',
+            'competitors': [
+                {'displayName': 'Penn State', 'isHome': True},
+                {'displayName': 'Campbell', 'isHome': False},
+            ],
+        },
+    ]}}}
+}
+
+SCHEDULE_HTML = (
+    "<html><head><title>Schedule</title></head><body>"
+    "<script>window['__espnfitt__']=" + json.dumps(SCHEDULE_DATA) + ";</script>"
+    "<div>" + "x" * 5000 + "</div></body></html>"
+).encode()
+
+
+GAME_HTML = (
+    b"<html><head><title>Campbell @ Penn State (Dec 2, 2025)</title></head><body>"
+    b'<script>window.__data={"gmStrp":{},"mtchpPrdctr":{"teams":['
+    b'{"value":35.2,"isHome":false},{"value":64.8,"isHome":true}]}};</script>'
+    b"</body></html>"
+)
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response serving a fixed body."""
+    
+    encoding = 'utf-8'
+    
+    def __init__(self, body: bytes):
+        self.content = body
+        self.chunks_read = 0
+        self.closed = False
+    
+    @property
+    def text(self):
+        return self.content.decode(self.encoding)
+    
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for start in range(0, len(self.content), chunk_size):
+            self.chunks_read += 1
+            yield self.content[start:start + chunk_size]
+    
+    def close(self):
+        self.closed = True
 
 
 class TestScraper:
@@ -46,6 +99,210 @@ class TestScraper:
             assert scraper.user_agent == Scraper.DEFAULT_USER_AGENT
         # Session should be closed after exiting context
     
+    def test_session_not_cached_by_default(self, monkeypatch):
+        """Test that the HTTP cache is opt-in."""
+        monkeypatch.delenv('B1G_CACHE', raising=False)
+        with Scraper() as scraper:
+            assert not scraper.is_cached
+            assert 'Cache-Control' in scraper.session.headers
+    
+    def test_session_cached_with_env_var(self, monkeypatch, tmp_path):
+        """Test that B1G_CACHE=1 installs a CachedSession."""
+        pytest.importorskip('requests_cache')
+        monkeypatch.setenv('B1G_CACHE', '1')
+        monkeypatch.chdir(tmp_path)
+        with Scraper() as scraper:
+            assert scraper.is_cached
+            assert 'Cache-Control' not in scraper.session.headers
+    
+    def test_session_created_once_across_threads(self, monkeypatch):
+        """Test that threads racing on first use share one configured session."""
+        import threading
+        import time
+        
+        created = []
+        create_session = Scraper._create_session
+        
+        def slow_create_session():
+            time.sleep(0.05)
+            created.append(create_session())
+            return created[-1]
+        
+        monkeypatch.setattr(Scraper, '_create_session', staticmethod(slow_create_session))
+        with Scraper() as scraper:
+            sessions = []
+            threads = [
+                threading.Thread(target=lambda: sessions.append(scraper.session))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert len(created) == 1
+        assert all(session is created[0] for session in sessions)
+        assert created[0].headers['User-Agent'] == Scraper.DEFAULT_USER_AGENT
+    
+    def test_session_adapter_pool_size(self):
+        """Test that the mounted adapter keeps a large connection pool."""
+        with Scraper() as scraper:
+            adapter = scraper.session.get_adapter("https://www.espn.com/")
+            assert adapter._pool_maxsize == 64
+    
+    def test_throttled_response_retried_only_by_get(self, monkeypatch):
+        """Test that a 429 with Retry-After is not also retried by urllib3."""
+        import threading
+        import requests
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from b1gpicks.scraper import RETRY_ATTEMPTS
+        
+        hits = []
+        
+        class TooManyRequests(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(429)
+                self.send_header('Retry-After', '0')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+            
+            def log_message(self, *args):
+                pass
+        
+        server = HTTPServer(('127.0.0.1', 0), TooManyRequests)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setattr(Scraper, '_throttle', lambda self, url, wait=None: None)
+        try:
+            with Scraper() as scraper:
+                with pytest.raises(requests.HTTPError):
+                    scraper.get(f"http://127.0.0.1:{server.server_port}/")
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert len(hits) == RETRY_ATTEMPTS
+    
+    def test_completed_games_never_expire(self, monkeypatch, tmp_path):
+        """Test that the cache ignores server expiry and keeps finished games."""
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        
+        pytest.importorskip('requests_cache')
+        monkeypatch.setenv('B1G_CACHE', '1')
+        monkeypatch.chdir(tmp_path)
+        hits = []
+        
+        class NoStore(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append((self.path, self.headers.get('Cache-Control')))
+                self.send_response(200)
+                self.send_header('Cache-Control', 'max-age=0')
+                self.send_header('Content-Length', str(len(GAME_HTML)))
+                self.end_headers()
+                self.wfile.write(GAME_HTML)
+            
+            def log_message(self, *args):
+                pass
+        
+        server = HTTPServer(('127.0.0.1', 0), NoStore)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_port}"
+        try:
+            with Scraper() as scraper:
+                scraper._completed_games.add(f"{base}/final")
+                for _ in range(3):
+                    assert scraper.get_game_predictor(f"{base}/final", delay=0)
+                    assert scraper.get_game_predictor(f"{base}/live", delay=0)
+                
+                expires = {response.url: response.expires for response in scraper.session.cache.filter()}
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        # One request each, without a Cache-Control header sent upstream
+        assert hits == [('/final', None), ('/live', None)]
+        assert expires[f"{base}/final"] is None
+        assert expires[f"{base}/live"] is not None
+    
+    def test_throttle_waits_only_for_remaining_interval(self, monkeypatch):
+        """Test that the per-host throttle spaces requests without padding."""
+        sleeps = []
+        monkeypatch.setattr('time.sleep', sleeps.append)
+        with Scraper() as scraper:
+            scraper._throttle("https://www.espn.com/a", 5)
+            scraper._throttle("https://example.com/a", 5)
+            assert sleeps == []
+            
+            scraper._throttle("https://www.espn.com/b", 5)
+            assert len(sleeps) == 1
+            assert 4 < sleeps[0] <= 5
+    
+    def test_throttle_defaults_to_host_interval(self, monkeypatch):
+        """Test that requests without an explicit delay use the host's floor."""
+        sleeps = []
+        monkeypatch.setattr('time.sleep', sleeps.append)
+        with Scraper() as scraper:
+            scraper._throttle("https://www.espn.com/a")
+            scraper._throttle("https://www.espn.com/b")
+            scraper._throttle("https://example.com/a")
+            scraper._throttle("https://example.com/b")
+        
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= DEFAULT_MIN_INTERVALS['www.espn.com']
+    
+    def test_back_off_delays_later_slots_from_now(self):
+        """Test that a back-off holds every later slot for the host."""
+        with Scraper() as scraper:
+            assert scraper._reserve_slot("https://www.espn.com/a", 0) == 0
+            scraper._back_off("https://www.espn.com/a", 5)
+            assert 4.9 < scraper._reserve_slot("https://www.espn.com/b", 0) <= 5
+            assert scraper._reserve_slot("https://example.com/a", 0) == 0
+    
+    def test_get_retries_throttled_response(self, monkeypatch):
+        """Test that 429 responses are retried, honouring Retry-After."""
+        import io
+        import requests
+        
+        statuses = [429, 200]
+        responses = []
+        
+        def fake_get(url, **kwargs):
+            response = requests.Response()
+            response.status_code = statuses.pop(0)
+            response.headers['Retry-After'] = '2'
+            response.url = url
+            response.raw = io.BytesIO(b'')
+            responses.append(response)
+            return response
+        
+        sleeps = []
+        monkeypatch.setattr('time.sleep', sleeps.append)
+        with Scraper() as scraper:
+            monkeypatch.setattr(scraper.session, 'get', fake_get)
+            response = scraper.get("https://www.espn.com/")
+        
+        assert response.status_code == 200
+        assert len(sleeps) == 1
+        assert 1.9 < sleeps[0] <= 2
+        # The throttled response is released before retrying
+        assert responses[0].raw.closed
+    
+    def test_import_defers_heavy_modules(self):
+        """Test that importing the package doesn't load heavy or unused modules."""
+        import subprocess
+        import sys
+        
+        code = (
+            "import sys, b1gpicks; "
+            "print(sorted(m for m in ('requests', 'bs4', 'lxml', 'asyncio', 'multiprocessing') "
+            "if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == '[]'
+    
     def test_scraper_get_requires_valid_url(self):
         """Test that scraper.get() fails with invalid URL."""
         scraper = Scraper()
@@ -69,6 +326,13 @@ class TestESPNMethods:
         url = Scraper.get_schedule_url(test_date, group=5)
         assert url == "https://www.espn.com/mens-college-basketball/schedule/_/date/20251215/group/5"
     
+    def test_get_schedule_url_ignores_time_of_day(self):
+        """Test that datetimes on the same day share one memoized URL."""
+        morning = Scraper.get_schedule_url(datetime(2025, 12, 3, 8, 0))
+        evening = Scraper.get_schedule_url(datetime(2025, 12, 3, 21, 30))
+        assert morning is evening
+        assert morning.endswith("/date/20251203/group/7")
+    
     def test_get_schedule_url_date_formatting(self):
         """Test that dates are formatted correctly in URLs."""
         test_date = datetime(2025, 1, 5)  # Single digit month and day
@@ -76,6 +340,483 @@ class TestESPNMethods:
         assert "20250105" in url
 
 
+class TestParsing:
+    """Test cases for offline HTML parsing helpers."""
+    
+    def test_xpath_is_cached(self):
+        """Test that repeated XPath expressions reuse one compiled object."""
+        assert _xpath("//a[contains(@href, '/game/')]") is _xpath("//a[contains(@href, '/game/')]")
+    
+    def test_get_soup_defaults_to_lxml(self, monkeypatch):
+        """Test that get_soup() parses with lxml rather than html.parser."""
+        class FakeResponse:
+            content = b'<html><head><title>Test</title></head></html>'
+        
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get', lambda self, url, **kwargs: FakeResponse())
+            soup = scraper.get_soup("https://example.com")
+            assert 'lxml' in soup.builder.features
+            assert soup.title.string == 'Test'
+    
+    def test_scrape_parses_only_the_title(self, monkeypatch):
+        """Test that scrape() strains the page down to its title."""
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get', lambda self, url, **kwargs: FakeResponse(GAME_HTML))
+            result = scraper.scrape("https://example.com")
+        assert result['title'] == 'Campbell @ Penn State (Dec 2, 2025)'
+    
+    def test_get_games_from_html_no_data(self):
+        """Test that the HTML fallback returns no games on an empty schedule."""
+        html = (
+            b'<div class="Table__NoData">No Data Available</div>'
+            b'<a href="/mens-college-basketball/game/_/gameId/1">x</a>'
+        )
+        with Scraper() as scraper:
+            assert scraper._get_games_from_html(html) == []
+    
+    def test_get_games_from_html_table_rows(self):
+        """Test that the HTML fallback reads teams from the game link's row."""
+        html = (
+            b'<table><tbody class="Table__TBODY"><tr>'
+            b'<td><a href="/team/_/id/1">Campbell</a></td>'
+            b'<td><a href="/team/_/id/2">Penn State</a></td>'
+            b'<td><a href="/mens-college-basketball/game/_/gameId/401827278">7:00 PM</a></td>'
+            b'<td><a href="/mens-college-basketball/game/_/gameId/401827278">Tickets</a></td>'
+            b'</tr></tbody></table>'
+        )
+        with Scraper() as scraper:
+            games = scraper._get_games_from_html(html)
+        assert games == [{
+            'away_team': 'Campbell',
+            'home_team': 'Penn State',
+            'game_url': 'https://www.espn.com/mens-college-basketball/game/_/gameId/401827278',
+        }]
+
+
+class TestScheduleParsing:
+    """Test cases for get_games_from_schedule with a stubbed response."""
+    
+    def test_games_from_espnfitt_json(self, monkeypatch):
+        """Test extracting games from the embedded schedule JSON."""
+        response = FakeResponse(SCHEDULE_HTML)
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get', lambda self, url, **kwargs: response)
+            games = scraper.get_games_from_schedule("https://example.com", delay=0)
+        
+        assert games == [{
+            'away_team': 'Campbell',
+            'home_team': 'Penn State',
+            'game_url': 'https://www.espn.com/mens-college-basketball/game/_/gameId/401827278',
+        }]
+    
+    def test_empty_schedule_skips_html_parse(self, monkeypatch):
+        """Test that a page without data or game links yields no games."""
+        response = FakeResponse(b'<html><body><div class="Table__NoData">No Data</div></body></html>')
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get', lambda self, url, **kwargs: response)
+            monkeypatch.setattr('lxml.html.fromstring', None)
+            assert scraper.get_games_from_schedule("https://example.com", delay=0) == []
+    
+    def test_html_fallback_refetch_is_throttled(self, monkeypatch):
+        """Test that refetching the full page for the fallback is throttled."""
+        response = FakeResponse(
+            b"<html><body><script>window['__espnfitt__']={broken};</script>"
+            + b"<div>" + b"x" * 5000 + b"</div></body></html>"
+        )
+        throttled = []
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get', lambda self, url, **kwargs: response)
+            monkeypatch.setattr(Scraper, '_throttle', lambda self, url, delay=None: throttled.append(url))
+            assert scraper.get_games_from_schedule("https://example.com") == []
+        
+        assert throttled == ["https://example.com", "https://example.com"]
+    
+    def test_stream_stops_after_script(self, monkeypatch):
+        """Test that the page stream is dropped once the data script closes."""
+        response = FakeResponse(SCHEDULE_HTML)
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get', lambda self, url, **kwargs: response)
+            script, body = scraper._stream_script(
+                "https://example.com", b"__espnfitt__", chunk_size=256
+            )
+        
+        assert script.startswith(b"__espnfitt__")
+        assert len(body) < len(SCHEDULE_HTML)
+        assert response.closed
+    
+    def test_get_tree_parses_page(self, monkeypatch):
+        """Test that get_tree returns a queryable Lexbor tree of the page."""
+        pytest.importorskip('selectolax')
+        response = FakeResponse(SCHEDULE_HTML)
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get', lambda self, url, **kwargs: response)
+            tree = scraper.get_tree("https://example.com")
+        
+        assert tree.css_first('title').text() == 'Schedule'
+    
+    def test_find_script_across_chunk_boundaries(self):
+        """Test that markers split between chunks are still found."""
+        chunks = [SCHEDULE_HTML[i:i + 7] for i in range(0, len(SCHEDULE_HTML), 7)]
+        script, _ = _find_script(chunks, b"window['__espnfitt__']")
+        with Scraper() as scraper:
+            games = scraper._games_from_schedule_script(script)
+        assert [game['home_team'] for game in games] == ['Penn State']
+    
+    def test_get_bytes_stops_at_max_bytes(self, monkeypatch):
+        """Test that get_bytes() truncates the body and closes the stream."""
+        response = FakeResponse(SCHEDULE_HTML)
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get', lambda self, url, **kwargs: response)
+            body = scraper.get_bytes("https://example.com", max_bytes=1000, chunk_size=256)
+        
+        assert body == SCHEDULE_HTML[:1000]
+        assert response.chunks_read == 4
+        assert response.closed
+
+
+class TestPredictorParsing:
+    """Test cases for parsing predictor data out of game page HTML."""
+    
+    def test_predictor_from_json(self):
+        """Test that the embedded mtchpPrdctr JSON assigns home/away by flag."""
+        with Scraper() as scraper:
+            predictor = scraper._parse_game_predictor(GAME_HTML)
+        assert predictor == {
+            'away_team': 'Campbell',
+            'home_team': 'Penn State',
+            'away_win_pct': 35.2,
+            'home_win_pct': 64.8,
+        }
+    
+    def test_predictor_from_svg_values_and_h1(self):
+        """Test the SVG fallback with team names taken from the h1."""
+        html = (
+            b"<html><head><title>Gamecast</title></head><body>"
+            b"<h1>Campbell @ Penn State</h1>"
+            b'<svg><path value="12.5"></path><path value="87.5"></path></svg>'
+            b"</body></html>"
+        )
+        with Scraper() as scraper:
+            predictor = scraper._parse_game_predictor(html)
+        assert predictor == {
+            'away_team': 'Campbell',
+            'home_team': 'Penn State',
+            'away_win_pct': 12.5,
+            'home_win_pct': 87.5,
+        }
+    
+    def test_predictor_stops_at_first_extractor(self, monkeypatch):
+        """Test that the markup fallback is not run once the JSON succeeds."""
+        def fail(tree, team_names):
+            raise AssertionError("markup fallback should not run")
+        
+        monkeypatch.setattr(Scraper, '_extract_from_markup', staticmethod(fail))
+        with Scraper() as scraper:
+            predictor = scraper._parse_game_predictor(GAME_HTML)
+        assert predictor['home_win_pct'] == 64.8
+    
+    def test_predictor_from_divs(self):
+        """Test the matchupPredictor div fallback."""
+        html = (
+            b"<html><head><title>Campbell @ Penn State</title></head><body>"
+            b'<div class="matchupPredictor__teamValue">40.1%</div>'
+            b'<div class="matchupPredictor__teamValue">59.9%</div>'
+            b"</body></html>"
+        )
+        with Scraper() as scraper:
+            predictor = scraper._parse_game_predictor(html)
+        assert (predictor['away_win_pct'], predictor['home_win_pct']) == (40.1, 59.9)
+    
+    def test_predictor_missing(self):
+        """Test that pages without predictor data return None."""
+        with Scraper() as scraper:
+            assert scraper._parse_game_predictor(b"<html><title>A @ B</title></html>") is None
+
+
+class TestDateRange:
+    """Test cases for scrape_games_by_date_range with stubbed fetches."""
+    
+    def test_iter_games_yields_date_and_position(self, monkeypatch):
+        """Test that games are streamed with their date and schedule slot."""
+        games = [
+            {'away_team': 'A', 'home_team': 'B', 'game_url': 'https://g/1'},
+            {'away_team': 'C', 'home_team': 'D', 'game_url': 'https://g/2'},
+        ]
+        
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get_games_from_schedule', lambda self, url, delay=None: games)
+            monkeypatch.setattr(Scraper, 'get_game_predictor', lambda self, url, delay=None: None)
+            items = list(scraper.iter_games_with_predictors(
+                start_date=datetime(2025, 12, 1),
+                num_days=1,
+                delay_between_pages=0,
+                delay_between_games=0
+            ))
+        
+        assert sorted((date, i, data['game_url']) for date, i, data in items) == [
+            ('2025-12-01', 0, 'https://g/1'),
+            ('2025-12-01', 1, 'https://g/2'),
+        ]
+    
+    def test_columnar_results_without_pandas(self, monkeypatch):
+        """Test that return_columnar gives a dict of columns without pandas."""
+        import sys
+        import threading
+        
+        monkeypatch.setitem(sys.modules, 'pandas', None)
+        games = [
+            {'away_team': 'A', 'home_team': 'B', 'game_url': 'https://g/1'},
+            {'away_team': 'C', 'home_team': 'D', 'game_url': 'https://g/2'},
+        ]
+        second_done = threading.Event()
+        
+        def fake_predictor(self, url, delay=None):
+            # Let the second game finish first, so rows arrive out of order
+            if url.endswith('/2'):
+                second_done.set()
+                return None
+            second_done.wait(5)
+            return {'away_team': 'A', 'home_team': 'B',
+                    'away_win_pct': 40.0, 'home_win_pct': 60.0}
+        
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get_games_from_schedule', lambda self, url, delay=None: games)
+            monkeypatch.setattr(Scraper, 'get_game_predictor', fake_predictor)
+            columns = scraper.scrape_games_by_date_range(
+                start_date=datetime(2025, 12, 1),
+                num_days=1,
+                delay_between_pages=0,
+                delay_between_games=0,
+                return_columnar=True
+            )
+        
+        assert columns['date'] == ['2025-12-01', '2025-12-01']
+        assert columns['home_team'] == ['B', 'D']
+        assert columns['home_win_pct'][0] == 60.0
+        assert columns['home_win_pct'][1] != columns['home_win_pct'][1]  # NaN
+        assert columns['home_win_pct'].typecode == 'd'
+    
+    def test_results_written_as_json_lines(self, monkeypatch, tmp_path):
+        """Test that out_path streams games to a JSONL file and returns a summary."""
+        game = {'away_team': 'A', 'home_team': 'B', 'game_url': 'https://g/1'}
+        out_path = tmp_path / 'games.jsonl'
+        
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get_games_from_schedule', lambda self, url, delay=None: [game])
+            monkeypatch.setattr(Scraper, 'get_game_predictor', lambda self, url, delay=None: None)
+            summary = scraper.scrape_games_by_date_range(
+                start_date=datetime(2025, 12, 1),
+                num_days=2,
+                delay_between_pages=0,
+                delay_between_games=0,
+                out_path=str(out_path)
+            )
+        
+        assert summary == {'path': str(out_path), 'days': 2, 'games': 2}
+        lines = [json.loads(line) for line in out_path.read_text().splitlines()]
+        assert sorted(line['date'] for line in lines) == ['2025-12-01', '2025-12-02']
+        assert all(line['game_url'] == 'https://g/1' for line in lines)
+    
+    def test_progress_printed_only_when_verbose(self, monkeypatch, capsys):
+        """Test that progress goes to stdout through the queue listener."""
+        import logging
+        
+        # Without application handlers (pytest installs its own on the root)
+        monkeypatch.setattr(logging.getLogger(), 'handlers', [])
+        monkeypatch.setattr(Scraper, 'get_games_from_schedule', lambda self, url, delay=None: [])
+        
+        for verbose in (True, False):
+            with Scraper(verbose=verbose) as scraper:
+                scraper.scrape_games_by_date_range(
+                    start_date=datetime(2025, 12, 1),
+                    num_days=1,
+                    delay_between_pages=0
+                )
+            out = capsys.readouterr().out
+            assert ("No games found for 2025-12-01" in out) is verbose
+    
+    def test_progress_left_to_application_logging(self, monkeypatch, capsys, caplog):
+        """Test that configured logging gets each message once, at its own level."""
+        import logging
+        from b1gpicks.scraper import logger
+        
+        monkeypatch.setattr(Scraper, 'get_games_from_schedule', lambda self, url, delay=None: [])
+        caplog.set_level(logging.INFO, logger=logger.name)
+        
+        with Scraper() as scraper:
+            scraper.scrape_games_by_date_range(
+                start_date=datetime(2025, 12, 1),
+                num_days=1,
+                delay_between_pages=0
+            )
+        
+        assert capsys.readouterr().out == ''
+        assert caplog.messages == ["  No games found for 2025-12-01"]
+        assert logger.level == logging.INFO
+        assert logger.handlers == []
+    
+    def test_unwritable_out_path_fails_before_scraping(self, monkeypatch, tmp_path):
+        """Test that a bad out_path raises instead of reporting success."""
+        fetched = []
+        monkeypatch.setattr(
+            Scraper, 'get_games_from_schedule', lambda self, url, delay=None: fetched.append(url) or []
+        )
+        
+        with Scraper() as scraper:
+            with pytest.raises(FileNotFoundError):
+                scraper.scrape_games_by_date_range(
+                    start_date=datetime(2025, 12, 1),
+                    num_days=1,
+                    out_path=str(tmp_path / 'missing' / 'games.jsonl')
+                )
+        assert fetched == []
+    
+    def test_writer_error_is_reraised(self, monkeypatch, tmp_path):
+        """Test that a failure on the writer thread reaches the caller."""
+        game = {'away_team': 'A', 'home_team': 'B', 'game_url': 'https://g/1'}
+        
+        def unserialisable(self, url, delay=None):
+            return {'away_team': 'A', 'home_team': 'B',
+                    'away_win_pct': object(), 'home_win_pct': object()}
+        
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get_games_from_schedule', lambda self, url, delay=None: [game])
+            monkeypatch.setattr(Scraper, 'get_game_predictor', unserialisable)
+            with pytest.raises(TypeError):
+                scraper.scrape_games_by_date_range(
+                    start_date=datetime(2025, 12, 1),
+                    num_days=1,
+                    delay_between_pages=0,
+                    delay_between_games=0,
+                    out_path=str(tmp_path / 'games.jsonl')
+                )
+    
+    def test_game_listed_on_two_days_is_fetched_once(self, monkeypatch):
+        """Test that a game_url seen on an earlier day is not fetched again."""
+        game = {'away_team': 'A', 'home_team': 'B', 'game_url': 'https://g/1'}
+        fetched = []
+        
+        def fake_predictor(self, url, delay=None):
+            fetched.append(url)
+            return {'away_team': 'A', 'home_team': 'B',
+                    'away_win_pct': 40.0, 'home_win_pct': 60.0}
+        
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get_games_from_schedule', lambda self, url, delay=None: [game])
+            monkeypatch.setattr(Scraper, 'get_game_predictor', fake_predictor)
+            results = scraper.scrape_games_by_date_range(
+                start_date=datetime(2025, 12, 1),
+                num_days=2,
+                delay_between_pages=0,
+                delay_between_games=0
+            )
+        
+        assert fetched == ['https://g/1']
+        assert [day['games'][0]['home_win_pct'] for day in results] == [60.0, 60.0]
+    
+    def test_results_keep_date_and_schedule_order(self, monkeypatch):
+        """Test that concurrent fetching still returns results in order."""
+        schedules = {
+            '20251201': [
+                {'away_team': 'A', 'home_team': 'B', 'game_url': 'https://g/1'},
+                {'away_team': 'C', 'home_team': 'D', 'game_url': 'https://g/2'},
+            ],
+            '20251202': [],
+        }
+        
+        def fake_games(self, url, delay=None):
+            return schedules[url.split('/date/')[1].split('/')[0]]
+        
+        def fake_predictor(self, url, delay=None):
+            if url.endswith('/2'):
+                return None
+            return {'away_team': 'A', 'home_team': 'B',
+                    'away_win_pct': 40.0, 'home_win_pct': 60.0}
+        
+        with Scraper() as scraper:
+            monkeypatch.setattr(Scraper, 'get_games_from_schedule', fake_games)
+            monkeypatch.setattr(Scraper, 'get_game_predictor', fake_predictor)
+            results = scraper.scrape_games_by_date_range(
+                start_date=datetime(2025, 12, 1),
+                num_days=2,
+                delay_between_pages=0,
+                delay_between_games=0
+            )
+        
+        assert [day['date'] for day in results] == ['2025-12-01', '2025-12-02']
+        first, second = results[0]['games']
+        assert first['away_win_pct'] == 40.0
+        assert first['home_win_pct'] == 60.0
+        assert second['game_url'] == 'https://g/2'
+        assert second['away_win_pct'] is None
+        assert results[1]['games'] == []
+    
+    def test_async_results_match_sync_format(self, monkeypatch):
+        """Test the asyncio/httpx path against a mocked transport."""
+        httpx = pytest.importorskip('httpx')
+        
+        def handler(request):
+            if '/schedule/' in request.url.path:
+                return httpx.Response(200, content=SCHEDULE_HTML)
+            return httpx.Response(200, content=GAME_HTML)
+        
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx, 'AsyncClient',
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+        )
+        with Scraper() as scraper:
+            results = asyncio.run(scraper.scrape_games_by_date_range_async(
+                start_date=datetime(2025, 12, 1),
+                num_days=2,
+                delay_between_pages=0,
+                delay_between_games=0
+            ))
+            # Worker processes are opt-in
+            assert scraper._parse_pool is None
+        
+        assert [day['date'] for day in results] == ['2025-12-01', '2025-12-02']
+        assert results[0]['games'] == [{
+            'away_team': 'Campbell',
+            'home_team': 'Penn State',
+            'game_url': 'https://www.espn.com/mens-college-basketball/game/_/gameId/401827278',
+            'away_win_pct': 35.2,
+            'home_win_pct': 64.8,
+        }]
+    
+    def test_async_failure_cancels_other_requests(self, monkeypatch):
+        """Test that a failed request stops the rest before the client closes."""
+        httpx = pytest.importorskip('httpx')
+        
+        async def handler(request):
+            if '/date/20251202/' in request.url.path:
+                return httpx.Response(500)
+            if '/schedule/' in request.url.path:
+                return httpx.Response(200, content=SCHEDULE_HTML)
+            # The game page would outlive the failed schedule request
+            await asyncio.sleep(10)
+            return httpx.Response(200, content=GAME_HTML)
+        
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx, 'AsyncClient',
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+        )
+        
+        async def scrape(scraper):
+            with pytest.raises(httpx.HTTPStatusError):
+                await scraper.scrape_games_by_date_range_async(
+                    start_date=datetime(2025, 12, 1),
+                    num_days=2,
+                    delay_between_pages=0,
+                    delay_between_games=0
+                )
+            return asyncio.all_tasks() - {asyncio.current_task()}
+        
+        with Scraper() as scraper:
+            assert asyncio.run(scrape(scraper)) == set()
+
+
 class TestScraperIntegration:
     """Integration tests for the Scraper class (require network access)."""
     